@@ -39,6 +39,7 @@ from ._utils import (
     _bspline,
     _are_collinear,
     _get_orthogonal_projection_onto_segment,
+    _split_selfloops,
 )
 
 
@@ -205,11 +206,11 @@ class BaseArcDiagram(BaseGraph):
         If the edge labels are to be distinct from the edge IDs, supply a dictionary mapping edges to edge labels.
         Only edges in the dictionary are labelled.
     edge_label_position : float, default 0.5
-        Relative position along the edge where the label is placed.
+        Relative position along the edge where the label is placed, measured from the source node.
 
-        - head   : 0.
+        - tail   : 0.
         - centre : 0.5
-        - tail   : 1.
+        - head   : 1.
 
     edge_label_rotate : bool, default True
         If True, edge labels are rotated such that they have the same orientation as their edge.
@@ -425,11 +426,11 @@ class ArcDiagram(BaseArcDiagram, Graph):
         If the edge labels are to be distinct from the edge IDs, supply a dictionary mapping edges to edge labels.
         Only edges in the dictionary are labelled.
     edge_label_position : float, default 0.5
-        Relative position along the edge where the label is placed.
+        Relative position along the edge where the label is placed, measured from the source node.
 
-        - head   : 0.
+        - tail   : 0.
         - centre : 0.5
-        - tail   : 1.
+        - head   : 1.
 
     edge_label_rotate : bool, default True
         If True, edge labels are rotated such that they have the same orientation as their edge.
@@ -509,8 +510,9 @@ class DraggableArcDiagram(ArcDiagram, DraggableGraph):
 
     def _update_edges(self, edges):
         edge_paths = dict()
-        edge_paths.update(self._update_arced_edge_paths([(source, target) for (source, target) in edges if source != target]))
-        edge_paths.update(self._update_selfloop_paths([(source, target) for (source, target) in edges if source == target]))
+        non_selfloops, selfloops = _split_selfloops(edges)
+        edge_paths.update(self._update_arced_edge_paths(non_selfloops))
+        edge_paths.update(self._update_selfloop_paths(selfloops))
         edge_paths = _lateralize_arced_edge_paths(edge_paths, self.node_positions, self.above)
         self.edge_paths.update(edge_paths)
         self._update_edge_artists(edge_paths)
@@ -674,11 +676,11 @@ class InteractiveArcDiagram(DraggableArcDiagram, EmphasizeOnHoverGraph, Annotate
         If the edge labels are to be distinct from the edge IDs, supply a dictionary mapping edges to edge labels.
         Only edges in the dictionary are labelled.
     edge_label_position : float, default 0.5
-        Relative position along the edge where the label is placed.
+        Relative position along the edge where the label is placed, measured from the source node.
 
-        - head   : 0.
+        - tail   : 0.
         - centre : 0.5
-        - tail   : 1.
+        - head   : 1.
 
     edge_label_rotate : bool, default True
         If True, edge labels are rotated such that they have the same orientation as their edge.
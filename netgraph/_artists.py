@@ -252,6 +252,10 @@ class EdgeArtist(PathPatchDataUnits):
         else:
             raise ValueError("Argument 'shape' needs to one of: 'left', 'right', 'full', not '{}'.".format(self.shape))
 
+        self._set_path(vertices, codes)
+
+
+    def _set_path(self, vertices, codes):
         self._path = Path(vertices, codes)
 
 
@@ -272,3 +276,105 @@ class EdgeArtist(PathPatchDataUnits):
             self.head_width *= ratio
         self.width = width
         self._update_path()
+
+
+# Vertex codes of the edge paths of straight edges, which are identical for all edges of a given shape.
+_STRAIGHT_EDGE_CODES = {
+    'full'  : np.array([Path.MOVETO] + 6 * [Path.LINETO] + [Path.CLOSEPOLY], dtype=Path.code_type),
+    'right' : np.array([Path.MOVETO] + 5 * [Path.LINETO] + [Path.CLOSEPOLY], dtype=Path.code_type),
+    'left'  : np.array([Path.MOVETO] + 5 * [Path.LINETO] + [Path.CLOSEPOLY], dtype=Path.code_type),
+}
+for _codes in _STRAIGHT_EDGE_CODES.values():
+    _codes.flags.writeable = False # the arrays are shared between paths
+
+
+def _update_straight_edge_artists(edge_artists, midlines):
+    """Update the midlines and paths of multiple edge artists with straight midlines at once.
+
+    This is equivalent to calling `EdgeArtist.update_midline` on each edge artist,
+    but the geometry of all arrows is computed using a single set of array operations.
+    Any changes to the geometry in `EdgeArtist._update_path` need to be mirrored here;
+    tests/test_artists.py::test_update_straight_edge_artists checks that both agree.
+
+    Parameters
+    ----------
+    edge_artists : list of EdgeArtist
+        The edge artists to update.
+    midlines : list of numpy.array
+        The corresponding (2, 2) arrays of (x, y) coordinates denoting the (straight) edge routes.
+
+    """
+
+    shapes = [edge_artist.shape for edge_artist in edge_artists]
+    for shape in set(shapes):
+        if shape not in _STRAIGHT_EDGE_CODES:
+            raise ValueError("Argument 'shape' needs to one of: 'left', 'right', 'full', not '{}'.".format(shape))
+
+    edge_paths = midlines
+    midlines = np.array(midlines, dtype=float)
+    width       = np.array([edge_artist.width       for edge_artist in edge_artists])[:, None]
+    head_width  = np.array([edge_artist.head_width  for edge_artist in edge_artists])[:, None]
+    head_length = np.array([edge_artist.head_length for edge_artist in edge_artists])[:, None]
+    offset      = np.array([edge_artist.offset      for edge_artist in edge_artists])[:, None]
+
+    start = midlines[:, 0]
+    stop = midlines[:, 1]
+
+    # Determine the actual endpoint of the arrow given the offset (cf. `_shorten_line_by`),
+    # and the base of the arrow head given the head length.
+    # NB: as in `_shorten_line_by`, degenerate edges (i.e. edges of length zero) result in NaNs
+    # but only if the edge actually needs to be shortened; hence we silence warnings for all other edges.
+    with np.errstate(divide='ignore', invalid='ignore'):
+        vector = start - stop
+        head_vertex_tip = np.where(offset > 0, stop + offset * vector / np.hypot(vector[:, :1], vector[:, 1:]), stop)
+        vector = start - head_vertex_tip
+        head_vertex_base = np.where(head_length > 0, head_vertex_tip + head_length * vector / np.hypot(vector[:, :1], vector[:, 1:]), head_vertex_tip)
+
+    # orthogonal vectors to the arrow head and arrow tail (cf. `_get_orthogonal_unit_vector`)
+    head_orthogonal = _get_orthogonal_unit_vector(head_vertex_tip - head_vertex_base) * head_width / 2.
+    tail_orthogonal = _get_orthogonal_unit_vector(head_vertex_base - start)
+
+    # vertices of each shape (cf. `EdgeArtist._update_path`)
+    vertices = np.empty((len(edge_artists), 8, 2))
+
+    is_full = np.array([shape == 'full' for shape in shapes])
+    if np.any(is_full):
+        right = -width[is_full] / 2. * tail_orthogonal[is_full]
+        left  =  width[is_full] / 2. * tail_orthogonal[is_full]
+        vertices[is_full, 0] = head_vertex_base[is_full] + right
+        vertices[is_full, 1] = start[is_full] + right
+        vertices[is_full, 2] = start[is_full] + left
+        vertices[is_full, 3] = head_vertex_base[is_full] + left
+        vertices[is_full, 4] = head_vertex_base[is_full] + head_orthogonal[is_full]
+        vertices[is_full, 5] = head_vertex_tip[is_full]
+        vertices[is_full, 6] = head_vertex_base[is_full] - head_orthogonal[is_full]
+        vertices[is_full, 7] = vertices[is_full, 0]
+
+    is_right = np.array([shape == 'right' for shape in shapes])
+    if np.any(is_right):
+        right  = -0.6 * width[is_right] * tail_orthogonal[is_right]
+        middle = -0.1 * width[is_right] * tail_orthogonal[is_right]
+        vertices[is_right, 0] = head_vertex_base[is_right] + right
+        vertices[is_right, 1] = start[is_right] + right
+        vertices[is_right, 2] = start[is_right] + middle
+        vertices[is_right, 3] = head_vertex_base[is_right] + middle
+        vertices[is_right, 4] = head_vertex_tip[is_right]
+        vertices[is_right, 5] = head_vertex_base[is_right] - head_orthogonal[is_right]
+        vertices[is_right, 6] = vertices[is_right, 0]
+
+    is_left = np.array([shape == 'left' for shape in shapes])
+    if np.any(is_left):
+        left   = 0.6 * width[is_left] * tail_orthogonal[is_left]
+        middle = 0.1 * width[is_left] * tail_orthogonal[is_left]
+        vertices[is_left, 0] = head_vertex_base[is_left] + middle
+        vertices[is_left, 1] = start[is_left] + middle
+        vertices[is_left, 2] = start[is_left] + left
+        vertices[is_left, 3] = head_vertex_base[is_left] + left
+        vertices[is_left, 4] = head_vertex_base[is_left] + head_orthogonal[is_left]
+        vertices[is_left, 5] = head_vertex_tip[is_left]
+        vertices[is_left, 6] = vertices[is_left, 0]
+
+    for ii, (edge_artist, shape) in enumerate(zip(edge_artists, shapes)):
+        codes = _STRAIGHT_EDGE_CODES[shape]
+        edge_artist.midline = edge_paths[ii]
+        edge_artist._set_path(vertices[ii, :len(codes)], codes)
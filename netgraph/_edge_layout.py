@@ -17,10 +17,12 @@ from matplotlib.patches import ConnectionStyle
 from ._utils import (
     _bspline,
     _get_n_points_on_a_circle,
+    _get_unit_circle,
     _get_angle,
     _get_unit_vector,
     _edge_list_to_adjacency_list,
-    _edge_list_to_adjacency_matrix,
+    _edge_list_to_index_array,
+    _get_node_position_array,
     _get_connected_components,
     _get_orthogonal_unit_vector,
 )
@@ -30,7 +32,6 @@ from ._node_layout import (
     _get_temperature_decay,
     _is_within_bbox,
     _rescale_to_frame,
-    _get_fr_attraction,
     _clip_to_frame,
 )
 
@@ -90,38 +91,40 @@ def get_straight_edge_paths(edges, node_positions, edge_width):
         Dictionary mapping each edge to an array of (x, y) coordinates representing its path.
 
     """
-    edge_paths = dict()
-    for (source, target) in edges:
-        if source == target:
-            # msg = "Plotting of self-loops not supported for straight edges."
-            # msg += "Ignoring edge ({}, {}).".format(source, target)
-            # warnings.warn(msg)
-            continue
+    # Plotting of self-loops is not supported for straight edges; they are ignored.
+    edges = [(source, target) for (source, target) in edges if source != target]
 
-        x1, y1 = node_positions[source]
-        x2, y2 = node_positions[target]
+    if not edges:
+        return dict()
 
-        # if (target, source) in edges: # i.e. bidirectional
-        #     # shift edge to the right (looking along the arrow)
-        #     x1, y1, x2, y2 = _shift_edge(x1, y1, x2, y2, delta=-0.5*edge_width[(source, target)])
+    # Gather the node positions using an (total edges, 2) array of node indices,
+    # which is considerably faster than converting a list of per-edge positions.
+    node_to_index = dict(zip(node_positions, range(len(node_positions))))
+    edge_indices = _edge_list_to_index_array(edges, node_to_index)
 
-        edge_paths[(source, target)] = np.c_[[x1, x2], [y1, y2]]
+    # Matplotlib paths store vertices as float64 arrays;
+    # creating the edge paths with that type avoids a conversion (i.e. a copy) when drawing them.
+    positions = _get_node_position_array(node_positions)
 
-    return edge_paths
+    # (total edges, 2 points, 2 coordinates)
+    paths = positions[edge_indices]
+
+    return dict(zip(edges, paths))
 
 
-def _shift_edge(x1, y1, x2, y2, delta):
-    """Determine the parallel to a segment defined by points p1: (x1, y1) and p2 : (x2, y2) at a distance delta."""
-    # convert segment into a vector
-    v = np.r_[x2-x1, y2-y1]
-    # compute orthogonal vector
-    v = np.r_[-v[1], v[0]]
-    # convert to orthogonal unit vector
-    v = v / np.linalg.norm(v)
-    # compute offsets
-    dx, dy = delta * v
-    # return new coordinates of point p1' and p2'
-    return x1+dx, y1+dy, x2+dx, y2+dy
+def _shift_edges(start, stop, delta):
+    """Determine the parallels to the segments defined by the start points (N, 2) and stop points (N, 2)
+    at distances delta (scalar or (N, ) array)."""
+    # compute orthogonal vectors to the segments
+    ox = start[:, 1] - stop[:, 1]
+    oy = stop[:, 0] - start[:, 0]
+    # compute offsets along the orthogonal unit vectors
+    scale = delta / np.hypot(ox, oy)
+    offset = np.empty_like(start, dtype=float)
+    offset[:, 0] = scale * ox
+    offset[:, 1] = scale * oy
+    # return new coordinates of points p1' and p2'
+    return start + offset, stop + offset
 
 
 def get_selfloop_paths(edges, node_positions, selfloop_radius, origin, scale, angle=None):
@@ -149,49 +152,62 @@ def get_selfloop_paths(edges, node_positions, selfloop_radius, origin, scale, an
 
     """
 
-    edge_paths = dict()
-    for (source, target) in edges:
-        if source != target:
-            # msg = "Edges must be self-loops."
-            # msg += f"Ignoring edge ({source}, {target})."
-            # warnings.warn(msg)
-            continue
+    selfloops = [(source, target) for (source, target) in edges if source == target]
+    if not selfloops:
+        return dict()
 
-        edge_paths[(source, target)] = _get_selfloop_path(
-            source, node_positions, selfloop_radius, origin, scale, angle)
+    # Compute all self-loops at once using a (total self-loops, 2) array of node positions.
+    positions = np.array([node_positions[source] for (source, _) in selfloops], dtype=float)
 
-    return edge_paths
+    if angle is not None:
+        unit_vector = _get_unit_vector(np.array([np.cos(angle), np.sin(angle)]))
+        unit_vectors = np.broadcast_to(unit_vector, positions.shape)
+    else:
+        # The centroid of the graph is the same for all self-loops; compute it only once.
+        centroid = _get_centroid_of_nodes(node_positions)
+        unit_vectors = _get_selfloop_directions(positions, centroid)
 
+    selfloop_centers = positions + selfloop_radius * unit_vectors
 
-def _get_selfloop_path(source, node_positions, selfloop_radius, origin, scale, angle=None):
-    """Compute the edge path for a single self-loop."""
+    # Each loop starts (and ends) at its node, i.e. at the point on the circle
+    # opposite to the unit vector. Rather than computing the corresponding start angle
+    # and rotating the points on the circle by that angle for each self-loop individually,
+    # we rotate all self-loops at once, using the fact that (cos(a + pi), sin(a + pi)) = -unit vector:
+    # cos(t + b) = cos(t)cos(b) - sin(t)sin(b), and sin(t + b) = cos(t)sin(b) + sin(t)cos(b).
+    unit_circle = _get_unit_circle(100+1)[1:]
+    cos_start, sin_start = -unit_vectors[:, 0], -unit_vectors[:, 1]
+    paths = np.empty((len(selfloops), len(unit_circle), 2))
+    paths[..., 0] = np.outer(cos_start, unit_circle[:, 0]) - np.outer(sin_start, unit_circle[:, 1])
+    paths[..., 1] = np.outer(sin_start, unit_circle[:, 0]) + np.outer(cos_start, unit_circle[:, 1])
+    paths *= selfloop_radius
+    paths += selfloop_centers[:, np.newaxis, :]
 
-    x, y = node_positions[source]
+    # # ensure that the loops stay within the bounding box
+    # paths = [_clip_to_frame(path, origin, scale) for path in paths]
 
-    if angle is not None:
-        unit_vector = _get_unit_vector(np.array([np.cos(angle), np.sin(angle)]))
-    else:
-        # To minimise overlap with other edges, we want the loop to be
-        # on the side of the node away from the centroid of the graph.
-        if len(node_positions) > 1:
-            centroid = np.mean(list(node_positions.values()), axis=0)
-            delta = node_positions[source] - centroid
-            distance = np.linalg.norm(delta)
-            unit_vector = delta / distance
-        else: # single node in graph; self-loop points upwards
-            unit_vector = np.array([0, 1])
+    return dict(zip(selfloops, paths))
 
-    selfloop_center = node_positions[source] + selfloop_radius * unit_vector
 
-    selfloop_path = _get_n_points_on_a_circle(
-        selfloop_center, selfloop_radius, 100+1,
-        _get_angle(*unit_vector) + np.pi,
-    )[1:]
+def _get_centroid_of_nodes(node_positions):
+    """Compute the centroid of all node positions."""
+    return np.mean(_get_node_position_array(node_positions), axis=0)
 
-    # # ensure that the loop stays within the bounding box
-    # selfloop_path = _clip_to_frame(selfloop_path, origin, scale)
 
-    return selfloop_path
+def _get_selfloop_directions(positions, centroid):
+    """Compute the unit vectors pointing from the centroid of the graph to the given (total nodes, 2) node positions.
+
+    To minimise overlap with other edges, we want the loop to be
+    on the side of the node away from the centroid of the graph.
+    If a node coincides with the centroid (e.g. as it is the only node in the graph),
+    the self-loop points upwards.
+    """
+    delta = positions - centroid
+    distance = np.hypot(delta[:, 0], delta[:, 1])
+    unit_vectors = np.zeros_like(delta)
+    unit_vectors[:, 1] = 1.
+    is_valid = distance > 0
+    unit_vectors[is_valid] = delta[is_valid] / distance[is_valid, np.newaxis]
+    return unit_vectors
 
 
 def get_curved_edge_paths(edges, node_positions,
@@ -228,6 +244,10 @@ def get_curved_edge_paths(edges, node_positions,
         If None, initialized to: 0.1 * sqrt(area / total nodes).
     total_iterations : int, default 50
         Number of iterations in the Fruchterman-Reingold algorithm.
+        If 0, the optimisation of the control point positions is skipped altogether, and edges
+        are drawn as splines through the initial control points, i.e. as straight lines between
+        source and target node (or as circles for self-loops). This is much faster for large graphs,
+        but edges do not avoid nodes or other edges.
     initial_temperature: float, default 1.
         Temperature controls the maximum node displacement on each iteration.
         Temperature is decreased on each iteration to eventually force the algorithm
@@ -250,7 +270,7 @@ def get_curved_edge_paths(edges, node_positions,
     # Therefor, we apply an additional fudge factor that pulls the edges a bit more taut.
     if k is None:
         total_nodes = len(node_positions)
-        area = np.product(scale)
+        area = scale[0] * scale[1]
         k = np.sqrt(area / float(total_nodes))
         k *= 0.1
 
@@ -259,10 +279,11 @@ def get_curved_edge_paths(edges, node_positions,
     control_point_positions = _initialize_control_point_positions(
         edge_to_control_points, node_positions, selfloop_radius, origin, scale)
 
-    control_point_positions = _optimize_control_point_positions(
-        edge_to_control_points, node_positions, control_point_positions,
-        origin, scale, k, initial_temperature, total_iterations, node_size,
-        bundle_parallel_edges)
+    if total_iterations > 0:
+        control_point_positions = _optimize_control_point_positions(
+            edge_to_control_points, node_positions, control_point_positions,
+            origin, scale, k, initial_temperature, total_iterations, node_size,
+            bundle_parallel_edges)
 
     edge_to_path = _get_path_through_control_points(
         edge_to_control_points, node_positions, control_point_positions)
@@ -294,8 +315,8 @@ def _expand_edges(edge_to_control_points):
     """
     expanded_edges = []
     for (source, target), control_points in edge_to_control_points.items():
-        sources = [source] + control_points
-        targets = control_points + [target]
+        sources = itertools.chain((source,), control_points)
+        targets = itertools.chain(control_points, (target,))
         expanded_edges.extend(zip(sources, targets))
     return expanded_edges
 
@@ -321,26 +342,34 @@ def _initialize_control_point_positions(edge_to_control_points, node_positions,
 
 
 def _initialize_nonloops(edge_to_control_points, node_positions):
-    """Merge control point : position dictionary for different non self-loops into a single dictionary."""
-    control_point_positions = dict()
-    for (source, target), control_points in edge_to_control_points.items():
-        control_point_positions.update(_init_nonloop(source, target, control_points, node_positions))
-    return control_point_positions
+    """Initialise the positions of the control points to positions on a straight line between source and target node.
 
+    The positions of all control points of all edges are computed in a single set of array operations.
+    """
+    if not edge_to_control_points:
+        return dict()
+
+    edges = list(edge_to_control_points.keys())
+    total_control_points = np.array([len(control_points) for control_points in edge_to_control_points.values()])
+    source_positions = np.array([node_positions[source] for source, _ in edges], dtype=float)
+    target_positions = np.array([node_positions[target] for _, target in edges], dtype=float)
+    delta = target_positions - source_positions
 
-def _init_nonloop(source, target, control_points, node_positions):
-    """Initialise the positions of the control points to positions on a straight line between source and target node."""
-    delta = node_positions[target] - node_positions[source]
-    output = dict()
     # Offset the path ever so slightly to a side, such that bi-directional edges do not overlap completely.
     # This prevents an intertwining of parallel edges.
     # Strictly speaking, this offset is only required if bundle_parallel_edges is false.
-    offset = 1e-6 * np.linalg.norm(delta) * np.squeeze(_get_orthogonal_unit_vector(np.atleast_2d(delta)))
-    for ii, control_point in enumerate(control_points):
-        # y = mx + b
-        m = (ii + 1) / (len(control_points) + 1)
-        output[control_point] = m * delta + node_positions[source] - offset
-    return output
+    offset = 1e-6 * np.linalg.norm(delta, axis=-1)[:, None] * _get_orthogonal_unit_vector(delta)
+
+    # For each control point, determine the corresponding edge, and
+    # the fraction of the distance between source and target, i.e.
+    # the equivalent of np.linspace(0, 1, total_control_points + 2)[1:-1] for each edge.
+    edge_index = np.repeat(np.arange(len(edges)), total_control_points)
+    first_index = np.cumsum(total_control_points) - total_control_points
+    fraction = (np.arange(len(edge_index)) - first_index[edge_index] + 1) / (total_control_points[edge_index] + 1)
+
+    positions = fraction[:, None] * delta[edge_index] + source_positions[edge_index] - offset[edge_index]
+    control_points = itertools.chain.from_iterable(edge_to_control_points.values())
+    return dict(zip(control_points, positions))
 
 
 def _initialize_selfloops(edge_to_control_points, node_positions,
@@ -348,28 +377,28 @@ def _initialize_selfloops(edge_to_control_points, node_positions,
                           origin          = np.array([0, 0]),
                           scale           = np.array([1, 1])):
     """Merge control point : position dictionary for different self-loops into a single dictionary."""
+    if not edge_to_control_points:
+        return dict()
+
+    # The centroid of the graph is the same for all self-loops; compute it only once.
+    centroid = _get_centroid_of_nodes(node_positions)
+    positions = np.array([node_positions[source] for (source, _) in edge_to_control_points], dtype=float)
+    unit_vectors = _get_selfloop_directions(positions, centroid)
+
     control_point_positions = dict()
-    for (source, target), control_points in edge_to_control_points.items():
+    for ((source, target), control_points), unit_vector in zip(edge_to_control_points.items(), unit_vectors):
         # Source and target have the same position, such that
         # using the strategy employed above the control points
         # also end up at the same position. Instead we make a loop.
         control_point_positions.update(
-            _init_selfloop(source, control_points, node_positions, selfloop_radius, origin, scale)
+            _init_selfloop(source, control_points, node_positions, selfloop_radius, origin, scale, unit_vector)
         )
     return control_point_positions
 
 
-def _init_selfloop(source, control_points, node_positions, selfloop_radius, origin, scale):
-    """Initialise the positions of control points to positions on a circle next to the node."""
-    # To minimise overlap with other edges, we want the loop to be
-    # on the side of the node away from the centroid of the graph.
-    if len(node_positions) > 1:
-        centroid = np.mean(list(node_positions.values()), axis=0)
-        delta = node_positions[source] - centroid
-        distance = np.linalg.norm(delta)
-        unit_vector = delta / distance
-    else: # single node in graph; self-loop points upwards
-        unit_vector = np.array([0, 1])
+def _init_selfloop(source, control_points, node_positions, selfloop_radius, origin, scale, unit_vector):
+    """Initialise the positions of control points to positions on a circle next to the node,
+    on the side of the node indicated by the unit vector."""
 
     selfloop_center = node_positions[source] + selfloop_radius * unit_vector
 
@@ -381,9 +410,7 @@ def _init_selfloop(source, control_points, node_positions, selfloop_radius, orig
     # # ensure that the loop stays within the bounding box
     # selfloop_control_point_positions = _clip_to_frame(selfloop_control_point_positions, origin, scale)
 
-    output = dict()
-    for ii, control_point in enumerate(control_points):
-        output[control_point] = selfloop_control_point_positions[ii]
+    output = dict(zip(control_points, selfloop_control_point_positions))
 
     return output
 
@@ -435,11 +462,16 @@ def _optimize_control_point_positions(
                 fixed_nodes         = nodes,
             )
 
+    nodes = set(nodes)
     return {node : xy for node, xy in expanded_node_positions.items() if node not in nodes}
 
 
 # This is a (slightly simplified) copy of the function defined in _node_layout.
-# This allows us to redefine the internally called function _get_fr_repulsion.
+# This allows us to redefine the internally called functions _get_fr_repulsion and _get_fr_attraction.
+# As repulsion only acts between fixed nodes and mobile nodes (i.e. control points),
+# and attraction only acts between connected nodes, the computational cost of each iteration
+# scales with (total fixed nodes * total mobile nodes + total edges),
+# rather than with the square of the total number of nodes.
 # TODO: find a way to avoid code repetition.
 # NOTE: Monkey patching did not work as intended (commit 435f187f99b8ff43d1d573c5e9302ea92cfa7eb2).
 def _get_fruchterman_reingold_layout(edges,
@@ -505,31 +537,41 @@ def _get_fruchterman_reingold_layout(edges,
 
     """
 
-    origin = np.array(origin)
-    scale = np.array(scale)
+    origin = np.asarray(origin)
+    scale = np.asarray(scale)
 
     unique_nodes = node_positions.keys()
     node_positions_as_array = np.array([node_positions[node] for node in unique_nodes])
     node_size = np.array([node_size[node] if node in node_size else 0. for node in unique_nodes])
 
-    adjacency = _edge_list_to_adjacency_matrix(
-        edges, edge_weights=edge_weights, unique_nodes=unique_nodes)
-
-    # Forces in FR are symmetric.
-    # Hence we need to ensure that the adjacency matrix is also symmetric.
-    adjacency = adjacency + adjacency.transpose()
-
-    # reorder adjacency to separate mobile and fixed positions
+    # separate mobile and fixed positions
+    fixed_nodes = set(fixed_nodes)
     is_mobile = np.array([False if node in fixed_nodes else True for node in unique_nodes], dtype=bool)
     mobile_positions = node_positions_as_array[is_mobile]
     fixed_positions = node_positions_as_array[~is_mobile]
     mobile_node_sizes = node_size[is_mobile]
     fixed_node_sizes = node_size[~is_mobile]
     total_mobile = np.sum(is_mobile)
-    reordered = np.zeros((adjacency.shape[0], total_mobile))
-    reordered[:total_mobile, :total_mobile] = adjacency[is_mobile][:, is_mobile]
-    reordered[total_mobile:, :total_mobile] = adjacency[~is_mobile][:, is_mobile]
-    adjacency = reordered
+
+    # Represent the edges as (node index, mobile node index, weight) triplets,
+    # where nodes are indexed in the order: mobile nodes, fixed nodes.
+    # Forces in FR are symmetric; hence each edge acts on both of its nodes, if they are mobile.
+    reordered_nodes = [node for node, mobile in zip(unique_nodes, is_mobile) if mobile] \
+        + [node for node, mobile in zip(unique_nodes, is_mobile) if not mobile]
+    node_to_index = dict(zip(reordered_nodes, range(len(reordered_nodes))))
+    sources, targets, weights = [], [], []
+    for edge in edges:
+        weight = edge_weights[edge] if edge_weights else 1.
+        source, target = node_to_index[edge[0]], node_to_index[edge[1]]
+        if target < total_mobile:
+            sources.append(source)
+            targets.append(target)
+            weights.append(weight)
+        if source < total_mobile:
+            sources.append(target)
+            targets.append(source)
+            weights.append(weight)
+    adjacency = (np.array(sources, dtype=int), np.array(targets, dtype=int), np.array(weights, dtype=float))
 
     temperatures = _get_temperature_decay(initial_temperature, total_iterations)
 
@@ -561,56 +603,80 @@ def _fruchterman_reingold(mobile_positions, fixed_positions,
                           adjacency, temperature, k):
     """Inner loop of Fruchterman-Reingold layout algorithm."""
 
-    combined_positions = np.concatenate([mobile_positions, fixed_positions], axis=0)
-    combined_node_radii = np.concatenate([mobile_node_radii, fixed_node_radii])
+    repulsion    = _get_fr_repulsion(mobile_positions, fixed_positions, mobile_node_radii, fixed_node_radii, k)
+    attraction   = _get_fr_attraction(mobile_positions, fixed_positions, mobile_node_radii, fixed_node_radii, adjacency, k)
+    displacement = attraction + repulsion
+
+    # limit maximum displacement using temperature
+    displacement_length = np.linalg.norm(displacement, axis=-1)
+    displacement = displacement / displacement_length[:, None] * np.clip(displacement_length, None, temperature)[:, None]
+
+    mobile_positions = mobile_positions + displacement
 
-    delta = mobile_positions[np.newaxis, :, :] - combined_positions[:, np.newaxis, :]
-    distance = np.linalg.norm(delta, axis=-1)
+    return mobile_positions
+
+
+def _get_fr_repulsion(mobile_positions, fixed_positions, mobile_node_radii, fixed_node_radii, k):
+    """Compute repulsive forces.
+
+    This is a variant of the implementation in the original FR
+    algorithm, in as much as repulsion only acts between fixed nodes
+    and mobile nodes, not between fixed nodes and other fixed nodes,
+    or mobile nodes and other mobile nodes.
+    """
+    # The difference vectors are stored as a (2, total fixed nodes, total mobile nodes) array,
+    # i.e. as one contiguous array per coordinate, as array operations on
+    # (total fixed nodes, total mobile nodes, 2) arrays are several times slower.
+    delta = mobile_positions.T[:, np.newaxis, :] - fixed_positions.T[:, :, np.newaxis]
+    distance = np.sqrt(delta[0]**2 + delta[1]**2)
 
     # alternatively: (hack adapted from igraph)
-    if np.sum(distance==0) - np.trace(distance==0) > 0: # i.e. if off-diagonal entries in distance are zero
+    is_zero = distance <= 0
+    if np.any(is_zero):
         warnings.warn("Some nodes have the same position; repulsion between the nodes is undefined.")
-        rand_delta = np.random.rand(*delta.shape) * 1e-9
-        is_zero = distance <= 0
-        delta[is_zero] = rand_delta[is_zero]
-        distance = np.linalg.norm(delta, axis=-1)
+        rand_delta = np.moveaxis(np.random.rand(*distance.shape, 2), -1, 0) * 1e-9
+        delta[:, is_zero] = rand_delta[:, is_zero]
+        distance = np.sqrt(delta[0]**2 + delta[1]**2)
 
     # subtract node radii from distances to prevent nodes from overlapping
-    distance -= mobile_node_radii[np.newaxis, :] + combined_node_radii[:, np.newaxis]
+    distance -= mobile_node_radii[np.newaxis, :] + fixed_node_radii[:, np.newaxis]
 
     # prevent distances from becoming less than zero due to overlap of nodes
     distance[distance <= 0.] = 1e-6 # 1e-13 is numerical accuracy, and we will be taking the square shortly
 
-    with np.errstate(divide='ignore', invalid='ignore'):
-        direction = delta / distance[..., None] # i.e. the unit vector
+    # k**2 / distance * delta / distance
+    magnitude = k**2 / distance**2
+    return np.einsum('ij,kij->jk', magnitude, delta)
 
-    # calculate forces
-    repulsion    = _get_fr_repulsion(distance, direction, k)
-    attraction   = _get_fr_attraction(distance, direction, adjacency, k)
-    displacement = attraction + repulsion
 
-    # limit maximum displacement using temperature
-    displacement_length = np.linalg.norm(displacement, axis=-1)
-    displacement = displacement / displacement_length[:, None] * np.clip(displacement_length, None, temperature)[:, None]
+def _get_fr_attraction(mobile_positions, fixed_positions, mobile_node_radii, fixed_node_radii, adjacency, k):
+    """Compute attractive forces.
 
-    mobile_positions = mobile_positions + displacement
+    Attraction only acts between connected nodes. Hence only forces along
+    edges are computed, rather than for all pairs of nodes.
+    """
+    sources, targets, weights = adjacency
 
-    return mobile_positions
+    combined_positions = np.concatenate([mobile_positions, fixed_positions], axis=0)
+    combined_node_radii = np.concatenate([mobile_node_radii, fixed_node_radii])
 
+    delta = mobile_positions[targets] - combined_positions[sources]
+    distance = np.sqrt(delta[:, 0]**2 + delta[:, 1]**2)
 
-def _get_fr_repulsion(distance, direction, k):
-    """Compute repulsive forces.
+    # subtract node radii from distances to prevent nodes from overlapping
+    distance -= mobile_node_radii[targets] + combined_node_radii[sources]
 
-    This is a variant of the implementation in the original FR
-    algorithm, in as much as repulsion only acts between fixed nodes
-    and mobile nodes, not between fixed nodes and other fixed nodes.
-    """
-    total_mobile = distance.shape[1]
-    distance = distance[total_mobile:]
-    direction = direction[total_mobile:]
-    magnitude = k**2 / distance
-    vectors = direction * magnitude[..., None]
-    return np.sum(vectors, axis=0)
+    # prevent distances from becoming less than zero due to overlap of nodes
+    distance[distance <= 0.] = 1e-6
+
+    # - 1/k * distance**2 * weight * delta / distance; NB: the minus!
+    magnitude = -1./k * distance * weights
+
+    total_mobile = len(mobile_positions)
+    return np.stack([
+        np.bincount(targets, weights=magnitude * delta[:, 0], minlength=total_mobile),
+        np.bincount(targets, weights=magnitude * delta[:, 1], minlength=total_mobile),
+    ], axis=-1)
 
 
 def _get_path_through_control_points(edge_to_control_points, node_positions, control_point_positions):
@@ -625,8 +691,20 @@ def _get_path_through_control_points(edge_to_control_points, node_positions, con
 
 
 def _fit_splines_through_edge_paths(edge_to_path, *args, **kwargs):
-    """Fit splines through edge paths for smoother edge routing."""
-    return {edge : _bspline(path, *args, **kwargs) for edge, path in edge_to_path.items()}
+    """Fit splines through edge paths for smoother edge routing.
+
+    Splines through paths with the same number of control points are computed jointly.
+    """
+    length_to_edges = dict()
+    for edge, path in edge_to_path.items():
+        length_to_edges.setdefault(len(path), []).append(edge)
+
+    edge_to_spline = dict()
+    for edges in length_to_edges.values():
+        paths = np.array([edge_to_path[edge] for edge in edges])
+        edge_to_spline.update(zip(edges, _bspline(paths, *args, **kwargs)))
+
+    return {edge : edge_to_spline[edge] for edge in edge_to_path}
 
 
 @_handle_multiple_components
@@ -681,9 +759,9 @@ def get_arced_edge_paths(edges, node_positions, rad=1.,
             node_positions[target],
             shrinkA=0., shrinkB=0.
             )
-        edge_paths[(source, target)] = _bspline(path.vertices, 100)
+        edge_paths[(source, target)] = path.vertices
 
-    return edge_paths
+    return _fit_splines_through_edge_paths(edge_paths, 100)
 
 
 @profile
@@ -1014,7 +1092,8 @@ def _smooth_path(path):
     """
 
     # Compute the linear length along the line:
-    distance = np.cumsum( np.sqrt(np.sum( np.diff(path, axis=0)**2, axis=1 )) )
+    delta = np.diff(path, axis=0)
+    distance = np.cumsum(np.hypot(delta[:, 0], delta[:, 1]))
     distance = np.insert(distance, 0, 0)/distance[-1]
 
     # Compute a spline function for each dimension:
@@ -17,11 +17,11 @@ try:
     from ._main import InteractiveGraph, BASE_SCALE, DraggableGraph
     from ._line_supercover import line_supercover
     from ._artists import NodeArtist, EdgeArtist
-    from ._parser import is_order_zero, is_empty, parse_graph
+    from ._parser import parse_graph
 except ValueError:
     from _main import InteractiveGraph, BASE_SCALE
     from _line_supercover import line_supercover
-    from _parser import is_order_zero, is_empty, parse_graph
+    from _parser import parse_graph
 
 
 class NascentEdge(plt.Line2D):
@@ -57,7 +57,10 @@ class MutableGraph(InteractiveGraph):
 
     def __init__(self, *args, **kwargs):
 
-        if is_order_zero(args[0]):
+        # Parse the graph only once to determine if it is order-zero or empty.
+        nodes, edges, _ = parse_graph(args[0])
+
+        if (not nodes) and (not edges):
             # The graph is order-zero, i.e. it has no edges and no nodes.
             # We hence initialise with a single edge, which populates
             # - last_selected_node_properties
@@ -70,9 +73,8 @@ class MutableGraph(InteractiveGraph):
             self._delete_node(0)
             self._delete_node(1)
 
-        elif is_empty(args[0]):
+        elif nodes and (not edges):
             # The graph is empty, i.e. it has at least one node but no edges.
-            nodes, _, _ = parse_graph(args[0])
             if len(nodes) > 1:
                 edge = (nodes[0], nodes[1])
                 super().__init__([edge], nodes=nodes, *args[1:], **kwargs)
@@ -153,6 +155,8 @@ class MutableGraph(InteractiveGraph):
             if self._nascent_edge:
                 self._remove_nascent_edge()
 
+        self.fig.canvas.draw_idle()
+
 
     def _add_nascent_edge(self, node):
         nascent_edge = NascentEdge(node, self.node_positions[node])
@@ -271,7 +275,8 @@ class MutableGraph(InteractiveGraph):
         nodes = [self._reverse_node_artists[artist] for artist in self._selected_artists if isinstance(artist, NodeArtist)]
 
         # delete edges to and from selected nodes
-        edges = [(source, target) for (source, target) in self.edges if ((source in nodes) or (target in nodes))]
+        node_set = set(nodes)
+        edges = [(source, target) for (source, target) in self.edges if ((source in node_set) or (target in node_set))]
         for edge in edges:
             self._delete_edge(edge)
 
@@ -3,6 +3,7 @@
 """
 Implements the BaseGraph, Graph, and InteractiveGraph classes.
 """
+import math
 import warnings
 import numpy as np
 import matplotlib as mpl
@@ -10,6 +11,7 @@ import matplotlib.pyplot as plt
 
 from uuid import uuid4
 from scipy.spatial import cKDTree
+from matplotlib.path import Path
 
 from ._utils import (
     _get_unique_nodes,
@@ -19,10 +21,13 @@ from ._utils import (
     _get_point_along_spline,
     _get_tangent_at_point,
     _get_text_object_dimensions,
+    _find_renderer,
     _make_pretty,
     _rank,
     _get_n_points_on_a_circle,
     _edge_list_to_adjacency_list,
+    _get_node_position_array,
+    _split_selfloops,
 )
 from ._node_layout import (
     get_fruchterman_reingold_layout,
@@ -41,14 +46,13 @@ from ._node_layout import (
 )
 from ._edge_layout import (
     get_straight_edge_paths,
-    _shift_edge,
+    _shift_edges,
     get_curved_edge_paths,
     get_arced_edge_paths,
     get_bundled_edge_paths,
     get_selfloop_paths,
-    _get_selfloop_path,
 )
-from ._artists import NodeArtist, EdgeArtist
+from ._artists import NodeArtist, EdgeArtist, _update_straight_edge_artists
 from ._parser import parse_graph, _parse_edge_list, _is_directed
 
 
@@ -199,11 +203,11 @@ class BaseGraph(object):
         If the edge labels are to be distinct from the edge IDs, supply a dictionary mapping edges to edge labels.
         Only edges in the dictionary are labelled.
     edge_label_position : float, default 0.5
-        Relative position along the edge where the label is placed.
+        Relative position along the edge where the label is placed, measured from the source node.
 
-        - head   : 0.
+        - tail   : 0.
         - centre : 0.5
-        - tail   : 1.
+        - head   : 1.
 
     edge_label_rotate : bool, default True
         If True, edge labels are rotated such that they have the same orientation as their edge.
@@ -286,22 +290,18 @@ class BaseGraph(object):
 
         # Convert all node and edge parameters to dictionaries.
         node_shape      = self._normalize_string_argument(node_shape, self.nodes, 'node_shape')
-        node_size       = self._normalize_numeric_argument(node_size, self.nodes, 'node_size')
-        node_edge_width = self._normalize_numeric_argument(node_edge_width, self.nodes, 'node_edge_width')
+        # Node sizes and edge widths are rescaled in the same pass.
+        node_size       = self._normalize_numeric_argument(node_size, self.nodes, 'node_size', BASE_SCALE)
+        node_edge_width = self._normalize_numeric_argument(node_edge_width, self.nodes, 'node_edge_width', BASE_SCALE)
         node_color      = self._normalize_color_argument(node_color, self.nodes, 'node_color')
         node_edge_color = self._normalize_color_argument(node_edge_color, self.nodes, 'node_edge_color')
         node_alpha      = self._normalize_numeric_argument(node_alpha, self.nodes, 'node_alpha')
         node_zorder     = self._normalize_numeric_argument(node_zorder, self.nodes, 'node_zorder')
-        edge_width      = self._normalize_numeric_argument(edge_width, self.edges, 'edge_width')
+        edge_width      = self._normalize_numeric_argument(edge_width, self.edges, 'edge_width', BASE_SCALE)
         edge_color      = self._normalize_color_argument(edge_color, self.edges, 'edge_color')
         edge_alpha      = self._normalize_numeric_argument(edge_alpha, self.edges, 'edge_alpha')
         edge_zorder     = self._normalize_numeric_argument(edge_zorder, self.edges, 'edge_zorder')
 
-        # Rescale.
-        node_size = self._rescale(node_size, BASE_SCALE)
-        node_edge_width = self._rescale(node_edge_width, BASE_SCALE)
-        edge_width = self._rescale(edge_width, BASE_SCALE)
-
         self.node_size = node_size
 
         # Initialise node and edge layouts.
@@ -372,12 +372,18 @@ class BaseGraph(object):
                 raise ValueError(msg)
 
 
-    def _normalize_numeric_argument(self, numeric_or_dict, dict_keys, variable_name):
+    def _normalize_numeric_argument(self, numeric_or_dict, dict_keys, variable_name, scalar=None):
+        # If given, values are multiplied by scalar;
+        # numeric arguments are rescaled before they are expanded into a dictionary.
         if isinstance(numeric_or_dict, (int, float)):
-            return {key : numeric_or_dict for key in dict_keys}
+            if scalar is not None:
+                numeric_or_dict = numeric_or_dict * scalar
+            return dict.fromkeys(dict_keys, numeric_or_dict)
         elif isinstance(numeric_or_dict, dict):
             self._check_completeness(numeric_or_dict, dict_keys, variable_name)
             self._check_types(numeric_or_dict.values(), (int, float), variable_name)
+            if scalar is not None:
+                return self._rescale(numeric_or_dict, scalar)
             return numeric_or_dict
         else:
             msg = f"The type of {variable_name} has to be either a int, float, or a dict."
@@ -414,7 +420,7 @@ class BaseGraph(object):
 
     def _normalize_string_argument(self, str_or_dict, dict_keys, variable_name):
         if isinstance(str_or_dict, str):
-            return {key : str_or_dict for key in dict_keys}
+            return dict.fromkeys(dict_keys, str_or_dict)
         elif isinstance(str_or_dict, dict):
             self._check_completeness(set(str_or_dict), dict_keys, variable_name)
             self._check_types(str_or_dict.values(), str, variable_name)
@@ -427,9 +433,9 @@ class BaseGraph(object):
 
     def _normalize_color_argument(self, color_or_dict, dict_keys, variable_name):
         if mpl.colors.is_color_like(color_or_dict):
-            return {key : color_or_dict for key in dict_keys}
+            return dict.fromkeys(dict_keys, color_or_dict)
         elif color_or_dict is None:
-            return {key : color_or_dict for key in dict_keys}
+            return dict.fromkeys(dict_keys, color_or_dict)
         elif isinstance(color_or_dict, dict):
             self._check_completeness(set(color_or_dict), dict_keys, variable_name)
             # TODO: assert that each element is a valid color
@@ -521,7 +527,7 @@ class BaseGraph(object):
             edge_layout_kwargs.setdefault('origin', origin)
             edge_layout_kwargs.setdefault('scale', scale)
             edge_layout_kwargs.setdefault('selfloop_radius', 0.05 * np.linalg.norm(scale))
-            # area = np.product(scale)
+            # area = scale[0] * scale[1]
             # k = np.sqrt(area / float(len(self.nodes))) # expected distance between nodes
             # # As there are multiple control points per edge,
             # # edge segments should be much shorter. k hence needs to be smaller.
@@ -599,6 +605,7 @@ class BaseGraph(object):
             Updates mapping of nodes to corresponding node artists.
 
         """
+        node_artists = []
         for node in nodes:
             node_artist = NodeArtist(shape=node_shape[node],
                                      xy=node_positions[node],
@@ -608,12 +615,14 @@ class BaseGraph(object):
                                      linewidth=node_edge_width[node],
                                      alpha=node_alpha[node],
                                      zorder=node_zorder[node])
-            self.ax.add_patch(node_artist)
+            node_artists.append(node_artist)
 
             if node in self.node_artists:
                 self.node_artists[node].remove()
             self.node_artists[node] = node_artist
 
+        self._add_patches(node_artists)
+
 
     def _update_node_artists(self, nodes):
         for node in nodes:
@@ -705,6 +714,7 @@ class BaseGraph(object):
 
         """
 
+        edge_artists = []
         for edge in edge_path:
 
             curved = False if (len(edge_path[edge]) == 2) else True
@@ -739,78 +749,118 @@ class BaseGraph(object):
                 curved      = curved,
                 zorder      = edge_zorder[edge],
             )
-            self.ax.add_patch(edge_artist)
+            edge_artists.append(edge_artist)
 
             if edge in self.edge_artists:
                 self.edge_artists[edge].remove()
             self.edge_artists[edge] = edge_artist
 
+        self._add_patches(edge_artists)
+
+
+    def _add_patches(self, artists):
+        """Add patches to the axis, and update the data limits once for all patches.
+
+        Axes.add_patch updates the data limits for each patch individually by
+        iterating over all Bezier segments of the patch path in python,
+        which dominates the time required to draw large graphs.
+        """
+        points = []
+        for artist in artists:
+            self.ax.add_artist(artist)
+            path = artist.get_path()
+            transform = artist.get_patch_transform()
+            if path.codes is None:
+                points.append(transform.transform(path.vertices))
+            elif np.any(np.isin(path.codes, (Path.CURVE3, Path.CURVE4))): # e.g. circular node artists
+                for curve, _ in path.iter_bezier(simplify=False):
+                    _, dzeros = curve.axis_aligned_extrema()
+                    points.append(transform.transform(curve([0, *dzeros, 1])))
+            else:
+                is_vertex = np.isin(path.codes, (Path.MOVETO, Path.LINETO))
+                points.append(transform.transform(path.vertices[is_vertex]))
+        if points:
+            # Non-finite points are ignored.
+            self.ax.update_datalim(np.concatenate(points, axis=0))
+
 
     def _update_edge_artists(self, edge_paths=None):
         if edge_paths is None:
             edge_paths = self.edge_paths
 
+        # NB: we do not draw each artist individually here;
+        # instead, the canvas is redrawn once by the caller after all artists have been updated.
+        straight_edge_artists = []
+        straight_edge_paths = []
         for edge, path in edge_paths.items():
-            self.edge_artists[edge].update_midline(path)
-            self.ax.draw_artist(self.edge_artists[edge])
+            if len(path) == 2:
+                straight_edge_artists.append(self.edge_artists[edge])
+                straight_edge_paths.append(path)
+            else:
+                self.edge_artists[edge].update_midline(path)
+
+        # compute the paths of all straight edges at once
+        if straight_edge_artists:
+            _update_straight_edge_artists(straight_edge_artists, straight_edge_paths)
 
 
     def _update_edges(self, edges):
         edge_paths = dict()
         if self.edge_layout == 'straight':
-            edge_paths.update(self._update_straight_edge_paths([(source, target) for (source, target) in edges if source != target]))
-            edge_paths.update(self._update_selfloop_paths([(source, target) for (source, target) in edges if source == target]))
+            non_selfloops, selfloops = _split_selfloops(edges)
+            edge_paths.update(self._update_straight_edge_paths(non_selfloops))
+            edge_paths.update(self._update_selfloop_paths(selfloops))
         elif self.edge_layout == 'curved':
             edge_paths.update(self._update_curved_edge_paths(edges))
         elif self.edge_layout == 'bundled':
             edge_paths.update(self._update_bundled_edge_paths(edges))
         elif self.edge_layout == 'arc':
-            edge_paths.update(self._update_arced_edge_paths([(source, target) for (source, target) in edges if source != target]))
-            edge_paths.update(self._update_selfloop_paths([(source, target) for (source, target) in edges if source == target]))
+            non_selfloops, selfloops = _split_selfloops(edges)
+            edge_paths.update(self._update_arced_edge_paths(non_selfloops))
+            edge_paths.update(self._update_selfloop_paths(selfloops))
         self.edge_paths.update(edge_paths)
         self._update_edge_artists(edge_paths)
 
 
     def _update_straight_edge_paths(self, edges):
-        # remove self-loops
-        edges = [(source, target) for source, target in edges if source != target]
-
-        edge_paths = dict()
-        for (source, target) in edges:
-            x0, y0 = self.node_positions[source]
-            x1, y1 = self.node_positions[target]
-
-            # # shift edge right if bi-directional
-            # if (target, source) in edges:
-            #     x0, y0, x1, y1 = _shift_edge(x0, y0, x1, y1, delta=-0.1*self.edge_artists[(source, target)].width)
+        # NB: self-loops have already been removed by the caller (see _split_selfloops)
+        if not edges:
+            return dict()
 
-            edge_paths[(source, target)] = np.c_[[x0, x1], [y0, y1]]
+        # Gather the positions of the stale edges only, and assemble all paths in a single
+        # (total edges, 2 points, 2 coordinates) array rather than one small array per edge.
+        edge_paths = np.empty((len(edges), 2, 2))
+        edge_paths[:, 0] = [self.node_positions[source] for (source, _) in edges]
+        edge_paths[:, 1] = [self.node_positions[target] for (_, target) in edges]
 
-        return edge_paths
+        return dict(zip(edges, edge_paths))
 
 
     def _update_selfloop_paths(self, edges):
         # restrict to self-loops
         edges = [(source, target) for source, target in edges if source == target]
 
-        edge_paths = dict()
-        for (source, target) in edges:
-            edge_paths[(source, target)] = _get_selfloop_path(
-                source,
-                node_positions  = self.node_positions,
-                selfloop_radius = self.edge_layout_kwargs['selfloop_radius'],
-                origin          = self.edge_layout_kwargs['origin'],
-                scale           = self.edge_layout_kwargs['scale'],
-                angle           = self.edge_layout_kwargs['selfloop_angle']
-            )
-        return edge_paths
+        # NB: not all edge layouts define the self-loop parameters below,
+        # hence we must not access them if there are no self-loops to update.
+        if not edges:
+            return dict()
+
+        return get_selfloop_paths(
+            edges,
+            node_positions  = self.node_positions,
+            selfloop_radius = self.edge_layout_kwargs['selfloop_radius'],
+            origin          = self.edge_layout_kwargs['origin'],
+            scale           = self.edge_layout_kwargs['scale'],
+            angle           = self.edge_layout_kwargs['selfloop_angle']
+        )
 
 
     def _update_curved_edge_paths(self, stale_edges):
         """Compute a new layout for curved edges keeping all other edges constant."""
 
         fixed_positions = dict()
-        constant_edges = [edge for edge in self.edges if edge not in stale_edges]
+        stale_edge_set = set(stale_edges)
+        constant_edges = [edge for edge in self.edges if edge not in stale_edge_set]
         for edge in constant_edges:
             edge_artist = self.edge_artists[edge]
             if edge_artist.curved:
@@ -841,7 +891,8 @@ class BaseGraph(object):
 
     def _initialize_node_label_offset(self, node_labels, node_label_offset):
         if isinstance(node_label_offset, (int, float)):
-            node_label_offset = {node : node_label_offset * self._get_vector_pointing_outwards(self.node_positions[node]) for node in node_labels}
+            centroid = self._get_centroid()
+            node_label_offset = {node : node_label_offset * self._get_vector_pointing_outwards(self.node_positions[node], centroid) for node in node_labels}
             recompute = True
             return node_label_offset, recompute
         elif isinstance(node_label_offset, (tuple, list, np.ndarray)):
@@ -860,13 +911,14 @@ class BaseGraph(object):
 
 
     def _get_centroid(self):
-        return np.mean([position for position in self.node_positions.values()], axis=0)
+        return np.mean(_get_node_position_array(self.node_positions), axis=0)
 
 
-    def _get_vector_pointing_outwards(self, xy):
-        centroid = self._get_centroid()
+    def _get_vector_pointing_outwards(self, xy, centroid=None):
+        if centroid is None:
+            centroid = self._get_centroid()
         delta = xy - centroid
-        distance = np.linalg.norm(delta)
+        distance = math.hypot(delta[0], delta[1])
         unit_vector = delta / distance
         return unit_vector
 
@@ -882,9 +934,10 @@ class BaseGraph(object):
 
         if np.all(np.isclose(node_label_offset, (0, 0))):
             # Labels are centered on node artists.
-            # Set fontsize such that labels fit the diameter of the node artists.
-            size = self._get_font_size(node_labels, node_label_fontdict) * 0.75 # conservative fudge factor
+            # Set fontsize such that labels fit the diameter of the node artists,
+            # unless the user specified a fontsize, in which case we can skip the (expensive) text measurements.
             if ('size' not in node_label_fontdict) and ('fontsize' not in node_label_fontdict):
+                size = self._get_font_size(node_labels, node_label_fontdict) * 0.75 # conservative fudge factor
                 node_label_fontdict.setdefault('size', size)
 
         return node_label_fontdict
@@ -896,12 +949,22 @@ class BaseGraph(object):
         # -----
         # - potentially rescale font sizes individually on a per node basis
 
+        # Determining the renderer can be expensive (for some backends, the figure is printed to a buffer);
+        # hence we only do it once.
+        renderer = _find_renderer(self.ax.get_figure())
+
+        # Measuring text objects is expensive; measure each distinct label only once.
+        label_to_diagonal = dict()
+        for label in node_labels.values():
+            if label not in label_to_diagonal:
+                width, height = _get_text_object_dimensions(self.ax, label, renderer=renderer, **node_label_fontdict)
+                label_to_diagonal[label] = math.hypot(width, height)
+
         rescale_factor = np.inf
         for node, label in node_labels.items():
             artist = self.node_artists[node]
             diameter = 2 * (artist.radius - artist._lw_data/artist.linewidth_correction)
-            width, height = _get_text_object_dimensions(self.ax, label, **node_label_fontdict)
-            rescale_factor = min(rescale_factor, diameter/np.sqrt(width**2 + height**2))
+            rescale_factor = min(rescale_factor, diameter/label_to_diagonal[label])
 
         if 'size' in node_label_fontdict:
             size = rescale_factor * node_label_fontdict['size']
@@ -941,29 +1004,55 @@ class BaseGraph(object):
         for node, label in node_labels.items():
             x, y = self.node_positions[node]
             dx, dy = self.node_label_offset[node]
-            artist = self.ax.text(x+dx, y+dy, label, **node_label_fontdict)
 
-            if node in self.node_label_artists:
-                self.node_label_artists[node].remove()
-            self.node_label_artists[node] = artist
+            if self._can_reuse_label_artist(self.node_label_artists.get(node), node_label_fontdict):
+                # Update the existing text object; creating a new one is comparatively expensive.
+                artist = self.node_label_artists[node]
+                artist.set_position((x+dx, y+dy))
+                artist.set_text(label)
+            else:
+                artist = self.ax.text(x+dx, y+dy, label, **node_label_fontdict)
+                artist._label_fontdict = dict(node_label_fontdict)
+                if node in self.node_label_artists:
+                    self.node_label_artists[node].remove()
+                self.node_label_artists[node] = artist
+
+
+    def _can_reuse_label_artist(self, artist, fontdict):
+        """Check if an existing label artist was created with the same fontdict.
 
+        Text.update only adds properties, such that properties set by a previous
+        fontdict would persist if the artist was updated with a different one.
+        """
+        if artist is None:
+            return False
+        try:
+            return bool(getattr(artist, '_label_fontdict', None) == fontdict)
+        except ValueError: # e.g. values are arrays that cannot be compared
+            return False
 
-    def _update_node_label_positions(self):
+
+    def _update_node_label_positions(self, nodes=None):
         if self._recompute_node_label_offsets:
+            # the offsets of all labels may change, hence all labels need to be updated
             self._update_node_label_offsets()
+            nodes = None
 
-        for node, (dx, dy) in self.node_label_offset.items():
-            x, y = self.node_positions[node]
-            self.node_label_artists[node].set_position((x + dx, y + dy))
+        if nodes is None:
+            nodes = self.node_label_offset.keys()
+
+        for node in nodes:
+            if node in self.node_label_offset: # i.e. node is labelled
+                dx, dy = self.node_label_offset[node]
+                x, y = self.node_positions[node]
+                self.node_label_artists[node].set_position((x + dx, y + dy))
 
 
     def _update_node_label_offsets(self, total_samples_per_edge=100):
-        fixed = []
-        for xy in self.node_positions.values():
-            fixed.append(xy)
+        fixed = [_get_node_position_array(self.node_positions)]
         for path in self.edge_paths.values():
-            fixed.extend([_get_point_along_spline(path, fraction) for fraction in np.arange(0, 1, 1./total_samples_per_edge)])
-        fixed = np.array(fixed)
+            fixed.append([_get_point_along_spline(path, fraction) for fraction in np.arange(0, 1, 1./total_samples_per_edge)])
+        fixed = np.concatenate(fixed)
 
         offsets = np.array(list(self.node_label_offset.values()))
         anchors = np.array([self.node_positions[node] for node in self.node_label_offset.keys()])
@@ -1048,10 +1137,10 @@ class BaseGraph(object):
             Mapping of edges to strings, the edge labels.
             Only edges in the dictionary are labelled.
         edge_label_position : float
-            Relative position along the edge where the label is placed.
-                head   : 0.
+            Relative position along the edge where the label is placed, measured from the source node.
+                tail   : 0.
                 centre : 0.5
-                tail   : 1.
+                head   : 1.
         edge_label_rotate : bool
             If True, edge labels are rotated such that they have the same orientation as their corresponding edge.
             If False, edge labels are not rotated; the angle of the text is parallel to the axis.
@@ -1083,22 +1172,26 @@ class BaseGraph(object):
                 dx, dy = _get_tangent_at_point(edge_artist.midline, edge_label_position)
                 angle = _get_angle(dx, dy, radians=True)
 
-                # make label orientation "right-side-up"
-                if angle > 90:
-                    angle -= 180
-                if angle < - 90:
-                    angle += 180
+                # make label orientation "right-side-up", i.e. map the angle to [-90, 90)
+                angle = (angle + 90) % 180 - 90
 
             else:
                 angle = None
 
-            edge_label_artist = self.ax.text(x, y, label,
-                                             rotation=angle,
-                                             **edge_label_fontdict)
-
-            if edge in self.edge_label_artists:
-                self.edge_label_artists[edge].remove()
-            self.edge_label_artists[edge] = edge_label_artist
+            if self._can_reuse_label_artist(self.edge_label_artists.get(edge), edge_label_fontdict):
+                # Update the existing text object; creating a new one is comparatively expensive.
+                edge_label_artist = self.edge_label_artists[edge]
+                edge_label_artist.set_position((x, y))
+                edge_label_artist.set_text(label)
+                edge_label_artist.set_rotation(angle)
+            else:
+                edge_label_artist = self.ax.text(x, y, label,
+                                                 rotation=angle,
+                                                 **edge_label_fontdict)
+                edge_label_artist._label_fontdict = dict(edge_label_fontdict)
+                if edge in self.edge_label_artists:
+                    self.edge_label_artists[edge].remove()
+                self.edge_label_artists[edge] = edge_label_artist
 
 
     def _is_selfloop(self, edge):
@@ -1107,42 +1200,82 @@ class BaseGraph(object):
 
     def _update_edge_label_positions(self, edges):
 
-        labeled_edges = [edge for edge in edges if edge in self.edge_label_artists]
+        fraction = self.edge_label_position
+
+        # NB: we look up each label artist and edge artist only once, and keep references to them.
+        label_artists = []
+        positions = []
+        tangents = []
+        straight_edges = []
+        straight_edge_artists = []
+        straight_label_artists = []
+        for (n1, n2) in edges:
 
-        for (n1, n2) in labeled_edges:
+            label_artist = self.edge_label_artists.get((n1, n2))
+            if label_artist is None:
+                continue
 
             edge_artist = self.edge_artists[(n1, n2)]
 
             if edge_artist.curved:
-                x, y = _get_point_along_spline(edge_artist.midline, self.edge_label_position)
-                dx, dy = _get_tangent_at_point(edge_artist.midline, self.edge_label_position)
-
-            elif not edge_artist.curved and (n1 != n2):
-                (x1, y1) = self.node_positions[n1]
-                (x2, y2) = self.node_positions[n2]
-
-                if (n2, n1) in self.edges: # i.e. bidirectional edge
-                    x1, y1, x2, y2 = _shift_edge(x1, y1, x2, y2, delta=1.5*self.edge_artists[(n1, n2)].width)
-
-                x, y = (x1 * self.edge_label_position + x2 * (1.0 - self.edge_label_position),
-                        y1 * self.edge_label_position + y2 * (1.0 - self.edge_label_position))
-                dx, dy = x2 - x1, y2 - y1
-
-            else: # self-loop but edge is straight so we skip it
-                pass
+                label_artists.append(label_artist)
+                positions.append(_get_point_along_spline(edge_artist.midline, fraction))
+                tangents.append(_get_tangent_at_point(edge_artist.midline, fraction))
+
+            elif n1 != n2:
+                straight_edges.append((n1, n2))
+                straight_edge_artists.append(edge_artist)
+                straight_label_artists.append(label_artist)
+
+            # else: self-loop but edge is straight so we skip it
+
+        if straight_edges:
+            # compute the label positions of all straight edges at once
+            start = np.array([self.node_positions[n1] for (n1, _) in straight_edges], dtype=float)
+            stop = np.array([self.node_positions[n2] for (_, n2) in straight_edges], dtype=float)
+
+            # Only bidirectional edges are shifted, and they are shifted all at once.
+            # NB: self.edge_artists is keyed by edge, and hence provides constant time look-ups
+            # without having to construct a set of all edges on each update.
+            is_bidirectional = np.array([(n2, n1) in self.edge_artists for (n1, n2) in straight_edges], dtype=bool)
+            if np.any(is_bidirectional):
+                delta = 1.5 * np.array([edge_artist.width for edge_artist in straight_edge_artists])[is_bidirectional]
+                start[is_bidirectional], stop[is_bidirectional] = \
+                    _shift_edges(start[is_bidirectional], stop[is_bidirectional], delta)
+
+            # As for curved edges (and in draw_edge_labels), the fraction is measured from the source node.
+            label_artists.extend(straight_label_artists)
+            positions.extend(start * (1.0 - fraction) + stop * fraction)
+            tangents.extend(stop - start)
+
+        if not label_artists:
+            return
+
+        for label_artist, position in zip(label_artists, positions):
+            label_artist.set_position(position)
+
+        if self.edge_label_rotate:
+            # compute the angles for all labels at once
+            positions = np.array(positions)
+            tangents = np.array(tangents)
+            angles = np.degrees(np.arctan2(tangents[:, 1], tangents[:, 0]))
+            # make label orientation "right-side-up", i.e. map the angles to [-90, 90)
+            angles = np.mod(angles + 90, 180) - 90
+            # transform data coordinate angles to screen coordinate angles
+            if self._is_angle_preserving():
+                trans_angles = angles
+            else:
+                trans_angles = self.ax.transData.transform_angles(angles, positions)
+            for label_artist, trans_angle in zip(label_artists, trans_angles):
+                label_artist.set_rotation(trans_angle)
 
-            self.edge_label_artists[(n1, n2)].set_position((x, y))
 
-            if self.edge_label_rotate:
-                angle = _get_angle(dx, dy, radians=True)
-                # make label orientation "right-side-up"
-                if angle > 90:
-                    angle -= 180
-                if angle < -90:
-                    angle += 180
-                # transform data coordinate angle to screen coordinate angle
-                trans_angle = self.ax.transData.transform_angles(np.array((angle,)), np.atleast_2d((x, y)))[0]
-                self.edge_label_artists[(n1, n2)].set_rotation(trans_angle)
+    def _is_angle_preserving(self):
+        """Check if angles in data coordinates are identical to angles in screen coordinates,
+        i.e. if both axes are linear, not inverted, and the aspect ratio is equal."""
+        return (self.ax.get_aspect() == 1) \
+            and (self.ax.get_xscale() == 'linear') and (self.ax.get_yscale() == 'linear') \
+            and not self.ax.xaxis_inverted() and not self.ax.yaxis_inverted()
 
 
     def _update_view(self):
@@ -1324,11 +1457,11 @@ class Graph(BaseGraph):
         If the edge labels are to be distinct from the edge IDs, supply a dictionary mapping edges to edge labels.
         Only edges in the dictionary are labelled.
     edge_label_position : float, default 0.5
-        Relative position along the edge where the label is placed.
+        Relative position along the edge where the label is placed, measured from the source node.
 
-        - head   : 0.
+        - tail   : 0.
         - centre : 0.5
-        - tail   : 1.
+        - head   : 1.
 
     edge_label_rotate : bool, default True
         If True, edge labels are rotated such that they have the same orientation as their edge.
@@ -1431,26 +1564,17 @@ def _get_color(mydict, cmap='RdGy', vmin=None, vmax=None):
     if vmin or vmax:
         values = np.clip(values, vmin, vmax)
 
-    def abs(value):
-        try:
-            return np.abs(value)
-        except TypeError as e: # value is probably None
-            if isinstance(value, type(None)):
-                return 0
-            else:
-                raise e
-
     # rescale values such that
     #  - the colormap midpoint is at zero-value, and
     #  - negative and positive values have comparable intensity values
-    values /= np.nanmax([np.nanmax(np.abs(values)), abs(vmax), abs(vmin)]) # [-1, 1]
+    values /= max(np.nanmax(np.abs(values)), abs(vmax or 0.), abs(vmin or 0.)) # [-1, 1]
     values += 1. # [0, 2]
-    values /= 2. # [0, 1]
+    values *= 0.5 # [0, 1]
 
-    # convert value to color
-    mapper = mpl.cm.ScalarMappable(cmap=cmap)
-    mapper.set_clim(vmin=0., vmax=1.)
-    colors = mapper.to_rgba(values)
+    # convert value to color;
+    # as values are already normalised to [0, 1], we can index the colormap
+    # (i.e. its lookup table) directly, instead of going through a ScalarMappable
+    colors = plt.get_cmap(cmap)(values)
 
     return {key: color for (key, color) in zip(keys, colors)}
 
@@ -1460,10 +1584,11 @@ def _get_zorder(color_dict):
     This assumes that the background is white.
 
     """
-    intensities = [rgba_to_grayscale(*v) for v in color_dict.values()]
+    rgba = np.array(list(color_dict.values()), dtype=float)
+    intensities = rgba_to_grayscale(*rgba.T)
     zorder = _rank(intensities)
-    zorder = np.max(zorder) - zorder # reverse order as greater values correspond to lighter colors
-    return {key: index for key, index in zip(color_dict.keys(), zorder)}
+    zorder = (len(zorder) - 1) - zorder # reverse order as greater values correspond to lighter colors; ranks are 0, ..., n-1
+    return dict(zip(color_dict.keys(), zorder.tolist()))
 
 
 def rgba_to_grayscale(r, g, b, a=1):
@@ -1521,8 +1646,9 @@ class ClickableArtists(object):
                     if event.key in ('control', 'super+??', 'ctrl+??'):
                         self._toggle_select_artist(artist)
                     else:
-                        self._deselect_all_other_artists(artist)
-                        self._toggle_select_artist(artist)
+                        self._deselect_all_other_artists(artist, redraw=False)
+                        self._toggle_select_artist(artist, redraw=False)
+                        self.fig.canvas.draw_idle()
                         # NOTE: if two artists are overlapping, only the first one encountered is selected!
                     break
             else:
@@ -1532,39 +1658,49 @@ class ClickableArtists(object):
             print("Warning: clicked outside axis limits!")
 
 
-    def _toggle_select_artist(self, artist):
+    # The `redraw` argument allows callers that change the state of many artists at once
+    # to request a single canvas redraw at the end, instead of one redraw per artist.
+    def _toggle_select_artist(self, artist, redraw=True):
         if artist in self._selected_artists:
-            self._deselect_artist(artist)
+            self._deselect_artist(artist, redraw)
         else:
-            self._select_artist(artist)
+            self._select_artist(artist, redraw)
 
 
-    def _select_artist(self, artist):
+    def _select_artist(self, artist, redraw=True):
         if not (artist in self._selected_artists):
             linewidth = artist._lw_data
             artist.set_linewidth(max(1.5 * linewidth, 0.003))
             artist.set_edgecolor('black')
             self._selected_artists.append(artist)
-            self.fig.canvas.draw_idle()
+            if redraw:
+                self.fig.canvas.draw_idle()
 
 
-    def _deselect_artist(self, artist):
+    def _deselect_artist(self, artist, redraw=True):
         if artist in self._selected_artists: # should always be true?
             artist.set_linewidth(self._base_linewidth[artist])
             artist.set_edgecolor(self._base_edgecolor[artist])
             self._selected_artists.remove(artist)
-            self.fig.canvas.draw_idle()
+            if redraw:
+                self.fig.canvas.draw_idle()
 
 
-    def _deselect_all_artists(self):
-        for artist in self._selected_artists[:]: # we make a copy of the list with [:], as we are modifying the list being iterated over
-            self._deselect_artist(artist)
+    def _deselect_all_artists(self, redraw=True):
+        if self._selected_artists:
+            for artist in self._selected_artists[:]: # we make a copy of the list with [:], as we are modifying the list being iterated over
+                self._deselect_artist(artist, redraw=False)
+            if redraw:
+                self.fig.canvas.draw_idle()
 
 
-    def _deselect_all_other_artists(self, artist_to_keep):
-        for artist in self._selected_artists[:]:
-            if artist != artist_to_keep:
-                self._deselect_artist(artist)
+    def _deselect_all_other_artists(self, artist_to_keep, redraw=True):
+        artists_to_deselect = [artist for artist in self._selected_artists if artist != artist_to_keep]
+        if artists_to_deselect:
+            for artist in artists_to_deselect:
+                self._deselect_artist(artist, redraw=False)
+            if redraw:
+                self.fig.canvas.draw_idle()
 
 
 class SelectableArtists(ClickableArtists):
@@ -1617,19 +1753,11 @@ class SelectableArtists(ClickableArtists):
 
         if self._currently_selecting:
             # select artists inside window
-            for artist in self._selectable_artists:
-                if isinstance(artist, NodeArtist):
-                    if self._is_inside_rect(*artist.xy):
-                        if event.key in ('control', 'super+??', 'ctrl+??'): # if/else probably superfluouos
-                            self._toggle_select_artist(artist)              # as no artists will be selected
-                        else:                                               # if control is not held previously
-                            self._select_artist(artist)                     #
-                elif isinstance(artist, EdgeArtist):
-                    if np.all([self._is_inside_rect(x, y) for x, y in artist.midline]):
-                        if event.key in ('control', 'super+??', 'ctrl+??'): # if/else probably superfluouos
-                            self._toggle_select_artist(artist)              # as no artists will be selected
-                        else:                                               # if control is not held previously
-                            self._select_artist(artist)                     #
+            for artist in self._get_artists_inside_rect():
+                if event.key in ('control', 'super+??', 'ctrl+??'):  # if/else probably superfluouos
+                    self._toggle_select_artist(artist, redraw=False) # as no artists will be selected
+                else:                                                # if control is not held previously
+                    self._select_artist(artist, redraw=False)        #
 
             # stop window selection and draw new state
             self._currently_selecting = False
@@ -1646,22 +1774,44 @@ class SelectableArtists(ClickableArtists):
                 self._selector_on()
 
 
+    def _get_artists_inside_rect(self):
+        # Test all artists against the selection window in a few vectorized operations:
+        # nodes are inside if their centre is inside; edges are inside if their entire midline is inside.
+        artists_inside = set()
+
+        node_artists = [artist for artist in self._selectable_artists if isinstance(artist, NodeArtist)]
+        if node_artists:
+            node_positions = np.array([artist.xy for artist in node_artists])
+            is_inside = self._is_inside_rect(node_positions[:, 0], node_positions[:, 1])
+            artists_inside.update(node_artists[ii] for ii in np.flatnonzero(is_inside))
+
+        edge_artists = [artist for artist in self._selectable_artists if isinstance(artist, EdgeArtist)]
+        if edge_artists:
+            midlines = [artist.midline for artist in edge_artists]
+            points = np.concatenate(midlines)
+            is_inside = self._is_inside_rect(points[:, 0], points[:, 1])
+            start = np.cumsum([0] + [len(midline) for midline in midlines[:-1]])
+            is_inside = np.logical_and.reduceat(is_inside, start)
+            artists_inside.update(edge_artists[ii] for ii in np.flatnonzero(is_inside))
+
+        return [artist for artist in self._selectable_artists if artist in artists_inside]
+
+
     def _is_inside_rect(self, x, y):
-        xlim = np.sort([self._x0, self._x1])
-        ylim = np.sort([self._y0, self._y1])
-        if (xlim[0]<=x) and (x<xlim[1]) and (ylim[0]<=y) and (y<ylim[1]):
-            return True
-        else:
-            return False
+        """Check if the point(s) (x, y) are inside the selection window.
+        Works element-wise if x and y are arrays."""
+        xmin, xmax = min(self._x0, self._x1), max(self._x0, self._x1)
+        ymin, ymax = min(self._y0, self._y1), max(self._y0, self._y1)
+        return (xmin <= x) & (x < xmax) & (ymin <= y) & (y < ymax)
 
 
     def _selector_on(self):
         self._rect.set_visible(True)
-        xlim = np.sort([self._x0, self._x1])
-        ylim = np.sort([self._y0, self._y1])
-        self._rect.set_xy((xlim[0], ylim[0]))
-        self._rect.set_width(xlim[1] - xlim[0])
-        self._rect.set_height(ylim[1] - ylim[0])
+        xmin, xmax = min(self._x0, self._x1), max(self._x0, self._x1)
+        ymin, ymax = min(self._y0, self._y1), max(self._y0, self._y1)
+        self._rect.set_xy((xmin, ymin))
+        self._rect.set_width(xmax - xmin)
+        self._rect.set_height(ymax - ymin)
         self.fig.canvas.draw_idle()
 
 
@@ -1701,9 +1851,10 @@ class DraggableArtists(SelectableArtists):
         if event.inaxes == self.ax:
             if self._currently_clicking_on_artist:
                 if self._currently_clicking_on_artist not in self._selected_artists:
+                    # no redraw required here, as the canvas is redrawn when the artists are moved below
                     if event.key not in ('control', 'super+??', 'ctrl+??'):
-                        self._deselect_all_artists()
-                    self._select_artist(self._currently_clicking_on_artist)
+                        self._deselect_all_artists(redraw=False)
+                    self._select_artist(self._currently_clicking_on_artist, redraw=False)
                 self._offset = {artist : artist.xy - np.array([event.xdata, event.ydata]) for artist in self._selected_artists if artist in self._draggable_artists}
                 self._currently_clicking_on_artist = None
                 self._currently_dragging = True
@@ -1754,15 +1905,16 @@ class DraggableGraph(Graph, DraggableArtists):
         self._update_node_artists(nodes)
 
         if hasattr(self, 'node_label_artists'):
-            self._update_node_label_positions()
+            self._update_node_label_positions(nodes)
 
         edges = self._get_stale_edges(nodes)
         # In the interest of speed, we only compute the straight edge paths here.
         # We will re-compute other edge layouts only on mouse button release,
         # i.e. when the dragging motion has stopped.
         edge_paths = dict()
-        edge_paths.update(self._update_straight_edge_paths([(source, target) for (source, target) in edges if source != target]))
-        edge_paths.update(self._update_selfloop_paths([(source, target) for (source, target) in edges if source == target]))
+        non_selfloops, selfloops = _split_selfloops(edges)
+        edge_paths.update(self._update_straight_edge_paths(non_selfloops))
+        edge_paths.update(self._update_selfloop_paths(selfloops))
         self.edge_paths.update(edge_paths)
         self._update_edge_artists(edge_paths)
 
@@ -1773,7 +1925,8 @@ class DraggableGraph(Graph, DraggableArtists):
 
 
     def _get_stale_nodes(self):
-        return [self._draggable_artist_to_node[artist] for artist in self._selected_artists if artist in self._draggable_artists]
+        # NB: membership is tested using the dictionary rather than the list of draggable artists for constant time look-ups
+        return [self._draggable_artist_to_node[artist] for artist in self._selected_artists if artist in self._draggable_artist_to_node]
 
 
     def _update_node_positions(self, nodes, cursor_position):
@@ -1784,6 +1937,7 @@ class DraggableGraph(Graph, DraggableArtists):
     def _get_stale_edges(self, nodes=None):
         if nodes is None:
             nodes = self._get_stale_nodes()
+        nodes = set(nodes) # for constant time look-ups
         return [(source, target) for (source, target) in self.edges if (source in nodes) or (target in nodes)]
 
 
@@ -1796,6 +1950,9 @@ class DraggableGraph(Graph, DraggableArtists):
             if hasattr(self, 'edge_label_artists'): # move edge labels
                 self._update_edge_label_positions(edges)
 
+        if self._currently_dragging:
+            self.fig.canvas.draw_idle()
+
         super()._on_release(event)
 
 
@@ -1904,7 +2061,7 @@ class DraggableGraphWithGridMode(DraggableGraph):
                 self.node_positions[node] = self._get_nearest_grid_coordinate(*self.node_positions[node])
             self._update_node_artists(nodes)
             if hasattr(self, 'node_label_artists'):
-                self._update_node_label_positions()
+                self._update_node_label_positions(nodes)
 
             edges = self._get_stale_edges(nodes)
             self._update_edges(edges)
@@ -2138,7 +2295,7 @@ class AnnotateOnClick(object):
     def _get_vector_pointing_outwards(self, xy):
         centroid = self._get_centroid()
         delta = xy - centroid
-        distance = np.linalg.norm(delta)
+        distance = math.hypot(delta[0], delta[1])
         unit_vector = delta / distance
         return unit_vector
 
@@ -2486,11 +2643,11 @@ class InteractiveGraph(DraggableGraphWithGridMode, EmphasizeOnHoverGraph, Annota
         If the edge labels are to be distinct from the edge IDs, supply a dictionary mapping edges to edge labels.
         Only edges in the dictionary are labelled.
     edge_label_position : float, default 0.5
-        Relative position along the edge where the label is placed.
+        Relative position along the edge where the label is placed, measured from the source node.
 
-        - head   : 0.
+        - tail   : 0.
         - centre : 0.5
-        - tail   : 1.
+        - head   : 1.
 
     edge_label_rotate : bool, default True
         If True, edge labels are rotated such that they have the same orientation as their edge.
@@ -353,8 +353,8 @@ def get_fruchterman_reingold_layout(edges,
     # This wrapper handles the initialization of variables to their defaults (if not explicitely provided),
     # and checks inputs for self-consistency.
 
-    origin = np.array(origin)
-    scale = np.array(scale)
+    origin = np.asarray(origin)
+    scale = np.asarray(scale)
     assert len(origin) == len(scale), \
         "Arguments `origin` (d={}) and `scale` (d={}) need to have the same number of dimensions!".format(len(origin), len(scale))
     dimensionality = len(origin)
@@ -449,7 +449,7 @@ def get_fruchterman_reingold_layout(edges,
         fixed_node_sizes = np.array([])
 
     if k is None:
-        area = np.product(scale)
+        area = scale[0] * scale[1]
         k = np.sqrt(area / float(total_nodes))
 
     temperatures = _get_temperature_decay(initial_temperature, total_iterations)
@@ -479,8 +479,8 @@ def get_fruchterman_reingold_layout(edges,
 
 def _is_within_bbox(points, origin, scale):
     """Check if each of the given points is within the bounding box given by origin and scale."""
-    minima = np.array(origin)
-    maxima = minima + np.array(scale)
+    minima = np.asarray(origin)
+    maxima = minima + np.asarray(scale)
     return np.all(np.logical_and(points >= minima, points <= maxima), axis=1)
 
 
@@ -504,16 +504,19 @@ def _fruchterman_reingold(mobile_positions, fixed_positions,
     combined_positions = np.concatenate([mobile_positions, fixed_positions], axis=0)
     combined_node_radii = np.concatenate([mobile_node_radii, fixed_node_radii])
 
-    delta = mobile_positions[np.newaxis, :, :] - combined_positions[:, np.newaxis, :]
-    distance = np.linalg.norm(delta, axis=-1)
+    # The difference vectors are stored as a (2, total nodes, total mobile nodes) array,
+    # i.e. as one contiguous array per coordinate, as array operations on
+    # (total nodes, total mobile nodes, 2) arrays are several times slower.
+    delta = mobile_positions.T[:, np.newaxis, :] - combined_positions.T[:, :, np.newaxis]
+    distance = _get_length(delta)
 
     # alternatively: (hack adapted from igraph)
-    if np.sum(distance==0) - np.trace(distance==0) > 0: # i.e. if off-diagonal entries in distance are zero
+    is_zero = distance <= 0
+    if np.count_nonzero(is_zero) - np.trace(is_zero) > 0: # i.e. if off-diagonal entries in distance are zero
         warnings.warn("Some nodes have the same position; repulsion between the nodes is undefined.")
-        rand_delta = np.random.rand(*delta.shape) * 1e-9
-        is_zero = distance <= 0
-        delta[is_zero] = rand_delta[is_zero]
-        distance = np.linalg.norm(delta, axis=-1)
+        rand_delta = np.moveaxis(np.random.rand(*distance.shape, 2), -1, 0) * 1e-9
+        delta[:, is_zero] = rand_delta[:, is_zero]
+        distance = _get_length(delta)
 
     # subtract node radii from distances to prevent nodes from overlapping
     distance -= mobile_node_radii[np.newaxis, :] + combined_node_radii[:, np.newaxis]
@@ -521,13 +524,25 @@ def _fruchterman_reingold(mobile_positions, fixed_positions,
     # prevent distances from becoming less than zero due to overlap of nodes
     distance[distance <= 0.] = 1e-6 # 1e-13 is numerical accuracy, and we will be taking the square shortly
 
-    with np.errstate(divide='ignore', invalid='ignore'):
-        direction = delta / distance[..., None] # i.e. the unit vector
+    # calculate force magnitudes
+    repulsion    = _get_fr_repulsion(distance, k)
+    attraction   = _get_fr_attraction(distance, adjacency, k)
+    magnitude    = repulsion
+    magnitude   -= attraction # NB: the minus!
 
-    # calculate forces
-    repulsion    = _get_fr_repulsion(distance, direction, k)
-    attraction   = _get_fr_attraction(distance, direction, adjacency, k)
-    displacement = attraction + repulsion
+    # Nodes do not exert forces on themselves.
+    # Note that we cannot apply the usual strategy of summing the array
+    # along either axis and subtracting the trace,
+    # as any sum or difference involving NaNs or infinities is just another NaN.
+    # Also we do not want to ignore NaNs by using np.nansum, as then we would
+    # potentially mask the existence of off-diagonal zero distances.
+    np.fill_diagonal(magnitude, 0)
+
+    # Weight the direction vectors (delta / distance) by the force magnitudes and sum over all other nodes
+    # in a single pass, without creating intermediate arrays of unit vectors or force vectors.
+    with np.errstate(divide='ignore', invalid='ignore'):
+        magnitude /= distance
+    displacement = np.einsum('ij,kij->jk', magnitude, delta)
 
     # limit maximum displacement using temperature
     displacement_length = np.linalg.norm(displacement, axis=-1)
@@ -538,29 +553,25 @@ def _fruchterman_reingold(mobile_positions, fixed_positions,
     return mobile_positions
 
 
-def _get_fr_repulsion(distance, direction, k):
-    """Compute repulsive forces."""
+def _get_length(delta):
+    """Compute the lengths of a (2, ...) array of difference vectors, using in-place operations where possible."""
+    length = np.square(delta[0])
+    length += np.square(delta[1])
+    return np.sqrt(length, out=length)
+
+
+def _get_fr_repulsion(distance, k):
+    """Compute the magnitudes of the repulsive forces."""
     with np.errstate(divide='ignore', invalid='ignore'):
-        magnitude = k**2 / distance
-    vectors = direction * magnitude[..., None]
-    # Note that we cannot apply the usual strategy of summing the array
-    # along either axis and subtracting the trace,
-    # as the diagonal of `direction` is np.nan, and any sum or difference of
-    # NaNs is just another NaN.
-    # Also we do not want to ignore NaNs by using np.nansum, as then we would
-    # potentially mask the existence of off-diagonal zero distances.
-    for ii in range(vectors.shape[-1]):
-        np.fill_diagonal(vectors[:, :, ii], 0)
-    return np.sum(vectors, axis=0)
+        return k**2 / distance
 
 
-def _get_fr_attraction(distance, direction, adjacency, k):
-    """Compute attractive forces."""
-    magnitude = 1./k * distance**2 * adjacency
-    vectors = -direction * magnitude[..., None] # NB: the minus!
-    for ii in range(vectors.shape[-1]):
-        np.fill_diagonal(vectors[:, :, ii], 0)
-    return np.sum(vectors, axis=0)
+def _get_fr_attraction(distance, adjacency, k):
+    """Compute the magnitudes of the attractive forces."""
+    magnitude = np.square(distance)
+    magnitude *= adjacency
+    magnitude *= 1./k
+    return magnitude
 
 
 def _rescale_to_frame(node_positions, origin, scale):
@@ -832,8 +843,9 @@ def _is_complete(edges):
     if len(edges) < len(minimal_complete_graph):
         return False
 
+    edge_set = set(edges) # for constant time look-up of edges and their reverse
     for edge in minimal_complete_graph:
-        if (edge not in edges) and (edge[::-1] not in edges):
+        if (edge not in edge_set) and (edge[::-1] not in edge_set):
             return False
 
     return True
@@ -1055,8 +1067,8 @@ def _get_voronoi_centroids(positions):
 
 def _clip_to_frame(positions, origin, scale):
     """Prevent node positions from leaving the bounding box given by origin and scale."""
-    origin = np.array(origin)
-    scale = np.array(scale)
+    origin = np.asarray(origin)
+    scale = np.asarray(scale)
     for ii, (minimum, maximum) in enumerate(zip(origin, origin+scale)):
         positions[:, ii] = np.clip(positions[:, ii], minimum, maximum)
     return positions
@@ -1278,8 +1290,9 @@ def _is_complete_bipartite(edges, left, right):
     if len(edges) < len(minimal_complete_graph):
         return False
 
+    edge_set = set(edges) # for constant time look-up of edges and their reverse
     for edge in minimal_complete_graph:
-        if (edge not in edges) and (edge[::-1] not in edges):
+        if (edge not in edge_set) and (edge[::-1] not in edge_set):
             return False
 
     return True
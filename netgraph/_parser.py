@@ -44,7 +44,7 @@ def _is_listlike(graph):
 @_handle_multigraphs
 def _parse_sparse_matrix_format(adjacency):
     """Parse graphs given in a sparse format, i.e. edge lists or sparse matrix representations."""
-    rows, columns = np.array(adjacency).shape
+    rows, columns = np.asarray(adjacency).shape
 
     if columns == 2:
         edges = _parse_edge_list(adjacency)
@@ -52,23 +52,26 @@ def _parse_sparse_matrix_format(adjacency):
         return nodes, edges, None
 
     elif columns == 3:
-        edge_weight = {(source, target) : weight for (source, target, weight) in adjacency}
-        edges = list(edge_weight.keys())
-        nodes = _get_unique_nodes(edges)
-
         # In a sparse adjacency format with integer nodes and float weights,
         # the type of nodes is promoted to the same type as weights.
         # If all nodes can safely be demoted to ints, then we probably want to do that.
+        # We determine this in the same pass in which we build the edge to weight mapping.
+        edge_weight = dict()
         save = True
-        for node in nodes:
-            if not isinstance(_save_cast_float_to_int(node), int):
-                save = False
-                break
+        for (source, target, weight) in adjacency:
+            if save:
+                save = isinstance(_save_cast_float_to_int(source), int) \
+                    and isinstance(_save_cast_float_to_int(target), int)
+            edge_weight[(source, target)] = weight
+
         if save:
-            nodes = [_save_cast_float_to_int(node) for node in nodes]
-            edges = [(_save_cast_float_to_int(source), _save_cast_float_to_int(target)) for (source, target) in edges]
             edge_weight = {(_save_cast_float_to_int(source), _save_cast_float_to_int(target)) : weight for (source, target), weight in edge_weight.items()}
 
+        edges = list(edge_weight.keys())
+        nodes = _get_unique_nodes(edges)
+
+        # NB: duplicate edges are overwritten in the mapping,
+        # hence only the weights of the remaining edges are compared.
         if len(set(edge_weight.values())) > 1:
             return nodes, edges, edge_weight
         else:
@@ -106,15 +109,16 @@ def _parse_nparray(graph):
 
 def _parse_adjacency_matrix(adjacency):
     """Parse graphs given in adjacency matrix format, i.e. a full-rank matrix."""
-    sources, targets = np.where(adjacency)
+    sources, targets = np.nonzero(adjacency)
+    weights = adjacency[sources, targets]
     edges = list(zip(sources.tolist(), targets.tolist()))
     nodes = list(range(adjacency.shape[0]))
-    edge_weights = {(source, target): adjacency[source, target] for (source, target) in edges}
 
-    if len(set(list(edge_weights.values()))) == 1:
+    # NB: np.ptp does not support boolean arrays, hence we compare the extrema directly
+    if weights.size and (weights.min() == weights.max()):
         return nodes, edges, None
     else:
-        return nodes, edges, edge_weights
+        return nodes, edges, dict(zip(edges, weights.tolist()))
 
 
 def _is_networkx(graph):
@@ -125,12 +129,17 @@ def _is_networkx(graph):
 @_handle_multigraphs
 def _parse_networkx_graph(graph, attribute_name='weight'):
     """Parse graphs represented as networkx.Graph or related objects."""
-    edges = list(graph.edges)
+    # Retrieve the edge attribute while iterating over the edges, instead of querying each edge individually.
+    if graph.is_multigraph():
+        edges_and_weights = [((source, target, key), weight) for source, target, key, weight in graph.edges(keys=True, data=attribute_name)]
+    else:
+        edges_and_weights = [((source, target), weight) for source, target, weight in graph.edges(data=attribute_name)]
+    edges = [edge for edge, _ in edges_and_weights]
     nodes = list(graph.nodes)
-    try:
-        edge_weights = {edge : graph.get_edge_data(*edge)[attribute_name] for edge in edges}
-    except KeyError: # no weights
+    if any(weight is None for _, weight in edges_and_weights): # no weights
         edge_weights = None
+    else:
+        edge_weights = dict(edges_and_weights)
     return nodes, edges, edge_weights
 
 
@@ -168,10 +177,8 @@ def _parse_graph_tool_graph(graph):
 
 def _is_directed(edges):
     """Check if the edge list contains bi-directional edges, i.e. at least one edge (a, b) for which (b, a) also exists."""
-    for (source, target) in edges:
-        if ((target, source) in edges) and (source != target):
-            return True
-    return False
+    edge_set = set(edges)
+    return any(((target, source) in edge_set) for (source, target) in edge_set if source != target)
 
 
 _check_to_parser = {
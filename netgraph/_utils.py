@@ -4,8 +4,11 @@
 Netgraph utility functions.
 """
 
+import math
+import itertools
 import numpy as np
 
+from functools import lru_cache
 from numpy.linalg import matrix_rank
 from scipy.interpolate import BSpline
 
@@ -38,6 +41,32 @@ def _get_unique_nodes(edges):
     return list(set(_flatten(edges)))
 
 
+def _split_selfloops(edges):
+    """Separate the edges into non-self-loops and self-loops in a single pass.
+
+    Parameters
+    ----------
+    edges: list of tuple
+        Edge list of the graph.
+
+    Returns
+    -------
+    non_selfloops: list of tuple
+        Edges for which the source node differs from the target node.
+    selfloops: list of tuple
+        Edges for which the source node is the target node.
+
+    """
+    non_selfloops = []
+    selfloops = []
+    for (source, target) in edges:
+        if source != target:
+            non_selfloops.append((source, target))
+        else:
+            selfloops.append((source, target))
+    return non_selfloops, selfloops
+
+
 def _flatten(nested_list):
     """Flatten a nested list."""
     return [item for sublist in nested_list for item in sublist]
@@ -62,8 +91,6 @@ def _edge_list_to_adjacency_matrix(edges, edge_weights=None, unique_nodes=None):
 
     """
 
-    sources = [s for (s, _) in edges]
-    targets = [t for (_, t) in edges]
     if edge_weights:
         weights = [edge_weights[edge] for edge in edges]
     else:
@@ -71,22 +98,60 @@ def _edge_list_to_adjacency_matrix(edges, edge_weights=None, unique_nodes=None):
 
     if unique_nodes is None:
         # map nodes to consecutive integers
-        nodes = sources + targets
-        unique_nodes = set(nodes)
+        unique_nodes = set(_flatten(edges))
 
     indices = range(len(unique_nodes))
     node_to_idx = dict(zip(unique_nodes, indices))
 
-    source_indices = [node_to_idx[source] for source in sources]
-    target_indices = [node_to_idx[target] for target in targets]
+    edge_indices = _edge_list_to_index_array(edges, node_to_idx)
 
     total_nodes = len(unique_nodes)
     adjacency_matrix = np.zeros((total_nodes, total_nodes))
-    adjacency_matrix[source_indices, target_indices] = weights
+    adjacency_matrix[edge_indices[:, 0], edge_indices[:, 1]] = weights
 
     return adjacency_matrix
 
 
+def _edge_list_to_index_array(edges, node_to_index):
+    """Convert an edge list into the corresponding array of node indices.
+
+    Parameters
+    ----------
+    edges : list of tuple
+        List of edges; each edge is identified by a (v1, v2) node tuple.
+    node_to_index : dict
+        Mapping of nodes to integer indices.
+
+    Returns
+    -------
+    edge_indices : numpy.array
+        (total edges, 2) integer array of (source index, target index) pairs.
+
+    """
+    flat = np.fromiter((node_to_index[node] for node in itertools.chain.from_iterable(edges)),
+                       dtype=int, count=2*len(edges))
+    return flat.reshape((len(edges), 2))
+
+
+def _get_node_position_array(node_positions):
+    """Stack the node positions into a single array.
+
+    Parameters
+    ----------
+    node_positions : dict
+        Mapping of nodes to (x, y) positions.
+
+    Returns
+    -------
+    positions : numpy.array
+        (total nodes, 2) float array of positions, in the order of the dictionary.
+
+    """
+    flat = np.fromiter(itertools.chain.from_iterable(node_positions.values()),
+                       dtype=float, count=2*len(node_positions))
+    return flat.reshape((len(node_positions), 2))
+
+
 def _edge_list_to_adjacency_list(edges, directed=True):
     """Convert an edge list representation of a unweighted graph into the corresponding adjacency list representation.
 
@@ -143,6 +208,8 @@ def _bspline(cv, n=100, degree=5, periodic=False):
     ----------
     cv : numpy.array
         Array of (x, y) control vertices.
+        Alternatively, a (total curves, total control vertices, 2) array,
+        in which case all curves are evaluated in a single call.
     n : int
         Number of samples to return.
     degree : int
@@ -153,7 +220,7 @@ def _bspline(cv, n=100, degree=5, periodic=False):
     Returns
     -------
     numpy.array
-        Array of (x, y) spline vertices.
+        Array of (x, y) spline vertices, or (total curves, n, 2) array if multiple curves were given.
 
     Notes
     -----
@@ -162,6 +229,14 @@ def _bspline(cv, n=100, degree=5, periodic=False):
     """
 
     cv = np.asarray(cv)
+
+    # BSpline supports coefficient arrays with trailing dimensions;
+    # hence multiple curves can be evaluated at once, provided that
+    # the control vertices are indexed along the first axis.
+    is_batch = cv.ndim == 3
+    if is_batch:
+        cv = np.moveaxis(cv, 0, 1)
+
     count = cv.shape[0]
 
     # Closed curve
@@ -179,12 +254,18 @@ def _bspline(cv, n=100, degree=5, periodic=False):
     # Return samples
     max_param = count - (degree * (1-periodic))
     spl = BSpline(kv, cv, degree)
-    return spl(np.linspace(0,max_param,n))
+    samples = spl(np.linspace(0,max_param,n))
+
+    if is_batch:
+        samples = np.moveaxis(samples, 1, 0)
+
+    return samples
 
 
 def _get_angle(dx, dy, radians=False):
     """Angle of a vector in 2D."""
-    angle = np.arctan2(dy, dx)
+    # math.atan2 is much faster than np.arctan2 for scalar arguments
+    angle = math.atan2(dy, dx)
     if radians:
         angle *= 360 / (2.0 * np.pi)
     return angle
@@ -266,12 +347,24 @@ def _get_signed_angle_between(v1, v2, radians=False):
     x2, y2 = v2
     dot = x1*x2 + y1*y2
     det = x1*y2 - y1*x2
-    angle = np.arctan2(det, dot)
+    angle = math.atan2(det, dot)
     if radians:
         angle *= 360 / (2 * np.pi)
     return angle
 
 
+@lru_cache(maxsize=64)
+def _get_unit_circle(n):
+    """Determine the positions of n evenly spaced points on the unit circle, starting at an angle of zero.
+
+    The result is cached, as it only depends on n; the returned array is hence read-only.
+    """
+    angles = np.linspace(0, 2*np.pi, n + 1)[:-1]
+    unit_circle = np.stack([np.cos(angles), np.sin(angles)], axis=-1)
+    unit_circle.flags.writeable = False
+    return unit_circle
+
+
 def _get_n_points_on_a_circle(xy, radius, n, start_angle=0):
     """Determine the positions of n evenly spaced points on a circle with a given (x, y) origin and radius.
 
@@ -293,9 +386,13 @@ def _get_n_points_on_a_circle(xy, radius, n, start_angle=0):
 
     """
 
-    angles = np.linspace(0, 2*np.pi, n + 1)[:-1]
-    angles = (angles + start_angle) % (2*np.pi)
-    positions = np.array([_get_point_on_a_circle(xy, radius, angle) for angle in angles])
+    # Rather than evaluating sine and cosine at each offset angle, we rotate
+    # n evenly spaced points on the unit circle by the start angle, i.e. we use
+    # the angle addition identities: cos(a + b) = cos(a)cos(b) - sin(a)sin(b), etc.
+    unit_circle = _get_unit_circle(n)
+    cos_start, sin_start = np.cos(start_angle), np.sin(start_angle)
+    rotation = np.array([[cos_start, sin_start], [-sin_start, cos_start]])
+    positions = np.asarray(xy, dtype=float) + radius * (unit_circle @ rotation)
     return positions
 
 
@@ -325,17 +422,15 @@ def _get_parallel_line(path, delta):
 
     """
 
-    # initialise output
-    orthogonal_unit_vector = np.zeros_like(path)
-
-    tangents = path[2:] - path[:-2] # using the central difference approximation
-    orthogonal_unit_vector[1:-1] = _get_orthogonal_unit_vector(tangents)
+    # Assemble all tangents first, such that the orthogonal unit vectors can be computed in a single call.
+    tangents = np.empty(path.shape)
+    tangents[1:-1] = path[2:] - path[:-2] # using the central difference approximation
 
     # handle start and end points
-    orthogonal_unit_vector[ 0] = _get_orthogonal_unit_vector(np.atleast_2d([path[ 1] - path[ 0]]))
-    orthogonal_unit_vector[-1] = _get_orthogonal_unit_vector(np.atleast_2d([path[-1] - path[-2]]))
+    tangents[ 0] = path[ 1] - path[ 0]
+    tangents[-1] = path[-1] - path[-2]
 
-    return path + delta * orthogonal_unit_vector
+    return path + delta * _get_orthogonal_unit_vector(tangents)
 
 
 def _get_orthogonal_unit_vector(v):
@@ -357,9 +452,12 @@ def _get_orthogonal_unit_vector(v):
 
     """
 
-    v = v / np.linalg.norm(v, axis=-1)[:, None] # unit vector
-    w = np.c_[-v[:,1], v[:,0]]                  # orthogonal vector
-    w = w / np.linalg.norm(w, axis=-1)[:, None] # orthogonal unit vector
+    # Rotating the unit vector by 90 degrees yields the orthogonal unit vector;
+    # we fill the output array directly rather than concatenating the columns (e.g. with np.c_).
+    length = np.hypot(v[:, 0], v[:, 1])
+    w = np.empty(v.shape)
+    w[:, 0] = -v[:, 1] / length
+    w[:, 1] =  v[:, 0] / length
     return w
 
 
@@ -421,7 +519,7 @@ def _get_point_along_spline(spline, fraction):
 
     assert 0 <= fraction <= 1, "Fraction has to be a value between 0 and 1."
     deltas = np.diff(spline, axis=0)
-    successive_distances = np.sqrt(np.sum(deltas**2, axis=1))
+    successive_distances = np.hypot(deltas[:, 0], deltas[:, 1])
     cumulative_sum = np.cumsum(successive_distances)
     desired_length = cumulative_sum[-1] * fraction
     idx = np.where(cumulative_sum >= desired_length)[0][0] # upper bound
@@ -449,7 +547,7 @@ def _get_tangent_at_point(spline, fraction):
 
     assert 0 <= fraction <= 1, "Fraction has to be a value between 0 and 1."
     deltas = np.diff(spline, axis=0)
-    successive_distances = np.sqrt(np.sum(deltas**2, axis=1))
+    successive_distances = np.hypot(deltas[:, 0], deltas[:, 1])
     cumulative_sum = np.cumsum(successive_distances)
     desired_length = cumulative_sum[-1] * fraction
     idx = np.where(cumulative_sum >= desired_length)[0][0] # upper bound
@@ -491,7 +589,7 @@ def _get_orthogonal_projection_onto_segment(point, segment):
     return p1 + t * (p2 - p1)
 
 
-def _get_text_object_dimensions(ax, string, *args, **kwargs):
+def _get_text_object_dimensions(ax, string, *args, renderer=None, **kwargs):
     """Precompute the dimensions of a text object on a given axis in data coordinates.
 
     Parameters
@@ -500,6 +598,10 @@ def _get_text_object_dimensions(ax, string, *args, **kwargs):
         The matplotlib axis.
     string : str
         The string.
+    renderer : matplotlib renderer or None, default None
+        The renderer used to determine the text extent.
+        If None, the renderer of the axis figure is determined, which can be expensive.
+        When measuring many strings, the renderer should hence be determined once and passed in.
     *args, **kwargs
         Passed to ax.text().
 
@@ -511,7 +613,8 @@ def _get_text_object_dimensions(ax, string, *args, **kwargs):
     """
 
     text_object = ax.text(0., 0., string, *args, **kwargs)
-    renderer = _find_renderer(text_object.get_figure())
+    if renderer is None:
+        renderer = _find_renderer(text_object.get_figure())
     bbox_in_display_coordinates = text_object.get_window_extent(renderer)
     bbox_in_data_coordinates = bbox_in_display_coordinates.transformed(ax.transData.inverted())
     w, h = bbox_in_data_coordinates.width, bbox_in_data_coordinates.height
@@ -533,6 +636,10 @@ def _find_renderer(fig):
         # Some backends, such as TkAgg, have the get_renderer method, which
         # makes this easy.
         renderer = fig.canvas.get_renderer()
+    elif hasattr(fig, "_get_renderer"):
+        # Since matplotlib 3.6, figures can provide a suitable renderer
+        # without printing the figure.
+        renderer = fig._get_renderer()
     else:
         # Other backends do not have the get_renderer method, so we have a work
         # around to find the renderer. Print the figure to a temporary file
@@ -11,6 +11,7 @@ from netgraph._artists import (
     PathPatchDataUnits,
     NodeArtist,
     EdgeArtist,
+    _update_straight_edge_artists,
 )
 from netgraph._utils import _bspline
 
@@ -176,3 +177,28 @@ def test_update_width():
     axes[0].set_title('Before')
     axes[1].set_title('After')
     return fig
+
+
+@pytest.mark.parametrize("shape", ['full', 'left', 'right'])
+@pytest.mark.parametrize("offset", [0., 0.1])
+@pytest.mark.parametrize("head_length", [0., 0.15])
+def test_update_straight_edge_artists(shape, offset, head_length):
+    # the batched path computation has to match EdgeArtist.update_midline
+    midlines = [
+        np.array([[0., 0.], [1., 1.]]),
+        np.array([[0.5, -0.2], [-0.3, 0.4]]),
+        np.array([[0.2, 0.2], [0.2, 0.2]]), # degenerate edge
+    ]
+    kwargs = dict(width=0.05, head_width=0.1, head_length=head_length, offset=offset, shape=shape)
+    expected = [EdgeArtist(np.array([[0., 0.], [1., 0.]]), **kwargs) for _ in midlines]
+    actual   = [EdgeArtist(np.array([[0., 0.], [1., 0.]]), **kwargs) for _ in midlines]
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for artist, midline in zip(expected, midlines):
+            artist.update_midline(midline)
+        _update_straight_edge_artists(actual, midlines)
+
+    for artist, reference, midline in zip(actual, expected, midlines):
+        assert np.array_equal(artist.midline, midline)
+        assert np.array_equal(artist.get_path().codes, reference.get_path().codes)
+        assert np.allclose(artist.get_path().vertices, reference.get_path().vertices, equal_nan=True)
@@ -8,6 +8,7 @@ import numpy as np
 import matplotlib.pyplot as plt
 
 from netgraph._main import Graph
+from netgraph._edge_layout import _shift_edges
 from netgraph._utils import _get_point_on_a_circle
 from toy_graphs import star
 
@@ -154,3 +155,27 @@ def test_draw_star_graph_with_bundled_edges():
     node_positions = {k : np.array(v) for k, v in node_positions.items()}
     Graph(star, node_layout=node_positions, edge_layout='bundled', ax=ax)
     return fig
+
+
+def test_selfloop_at_centroid():
+    # the self-loop direction is undefined for a node at the centroid of the graph
+    edges = [(0, 1), (1, 2), (2, 2)]
+    node_layout = {
+        0 : np.array([0.1, 0.5]),
+        1 : np.array([0.9, 0.5]),
+        2 : np.array([0.5, 0.5]), # centroid
+    }
+    fig, ax = plt.subplots()
+    g = Graph(edges, node_layout=node_layout, ax=ax)
+    assert np.all(np.isfinite(g.edge_paths[(2, 2)]))
+    plt.close(fig)
+
+
+def test_shift_edges():
+    start = np.array([[0., 0.], [1., 1.]])
+    stop  = np.array([[1., 0.], [1., 3.]])
+    delta = np.array([0.5, 0.25])
+    new_start, new_stop = _shift_edges(start, stop, delta)
+    # edges are shifted orthogonally to their direction, i.e. to the left of the direction of travel for positive delta
+    assert np.allclose(new_start, [[0., 0.5], [0.75, 1.]])
+    assert np.allclose(new_stop,  [[1., 0.5], [0.75, 3.]])
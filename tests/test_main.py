@@ -7,7 +7,9 @@ import pytest
 import numpy as np
 import matplotlib.pyplot as plt
 
-from netgraph._main import Graph
+from types import SimpleNamespace
+
+from netgraph._main import Graph, DraggableGraph, InteractiveGraph
 from toy_graphs import cube, cycle
 
 np.random.seed(42)
@@ -80,3 +82,90 @@ def test_get_node_label_offset():
     fig, ax = plt.subplots()
     Graph(cycle, node_layout='circular', node_labels=True, node_label_offset=0.1)
     return fig
+
+
+def test_edge_label_position_is_stable_during_drag():
+    # off-centre labels should remain in place when a node is "dragged" to its current position
+    fig, ax = plt.subplots()
+    node_layout = {
+        0 : np.array([0.1, 0.1]),
+        1 : np.array([0.9, 0.5]),
+    }
+    g = DraggableGraph([(0, 1)], node_layout=node_layout, edge_labels={(0, 1) : 'lorem'}, edge_label_position=0.25, ax=ax)
+    before = np.array(g.edge_label_artists[(0, 1)].get_position())
+
+    node_artist = g.node_artists[0]
+    g._select_artist(node_artist)
+    g._offset = {node_artist : np.zeros(2)}
+    x, y = g.node_positions[0]
+    g._move(SimpleNamespace(xdata=x, ydata=y))
+
+    after = np.array(g.edge_label_artists[(0, 1)].get_position())
+    assert np.allclose(before, after)
+    plt.close(fig)
+
+
+def test_redrawing_labels_with_different_fontdict():
+    # properties of a previous fontdict should not persist when labels are redrawn
+    fig, ax = plt.subplots()
+    g = Graph([(0, 1)], node_labels=True, edge_labels=True, ax=ax)
+    default_color = g.node_label_artists[0].get_color()
+
+    g.draw_node_labels({0 : 'lorem'}, dict(color='red', fontweight='bold'))
+    g.draw_edge_labels({(0, 1) : 'ipsum'}, 0.5, True, dict(color='red', fontweight='bold'))
+    assert g.node_label_artists[0].get_color() == 'red'
+    assert g.edge_label_artists[(0, 1)].get_color() == 'red'
+
+    g.draw_node_labels({0 : 'lorem'}, dict())
+    g.draw_edge_labels({(0, 1) : 'ipsum'}, 0.5, True, dict())
+    assert g.node_label_artists[0].get_color() == default_color
+    assert g.node_label_artists[0].get_fontweight() == 'normal'
+    assert g.edge_label_artists[(0, 1)].get_color() == default_color
+    assert g.edge_label_artists[(0, 1)].get_fontweight() == 'normal'
+    assert sum(text.get_text() == 'lorem' for text in ax.texts) == 1
+    plt.close(fig)
+
+
+@pytest.mark.parametrize("edge_layout", ['curved', 'bundled'])
+def test_drag_without_selfloops(edge_layout):
+    # dragging a node should not require self-loop parameters if there are no self-loops
+    fig, ax = plt.subplots()
+    g = InteractiveGraph([(0, 1), (1, 2), (2, 0)], edge_layout=edge_layout, ax=ax)
+
+    node_artist = g.node_artists[0]
+    g._select_artist(node_artist)
+    g._offset = {node_artist : np.zeros(2)}
+    x, y = g.node_positions[0] + 0.05
+    g._move(SimpleNamespace(xdata=x, ydata=y))
+
+    assert np.allclose(g.node_positions[0], (x, y))
+    plt.close(fig)
+
+
+def test_edge_label_rotation_of_axis_aligned_edges():
+    # Labels are kept "right-side-up" by mapping angles to [-90, 90),
+    # i.e. labels on horizontal edges are not rotated, and labels on vertical edges are rotated by -90 degrees,
+    # irrespective of edge direction. Drawing and updating the labels must agree.
+    edges = [(0, 1), (2, 3), (4, 5), (6, 7)]
+    node_layout = {
+        0 : np.array([0.1, 0.1]), 1 : np.array([0.4, 0.1]), # right
+        2 : np.array([0.4, 0.3]), 3 : np.array([0.1, 0.3]), # left
+        4 : np.array([0.6, 0.1]), 5 : np.array([0.6, 0.4]), # up
+        6 : np.array([0.8, 0.4]), 7 : np.array([0.8, 0.1]), # down
+    }
+    expected = {(0, 1) : 0., (2, 3) : 0., (4, 5) : -90., (6, 7) : -90.}
+
+    def get_rotations(g):
+        # Text.get_rotation returns angles in [0, 360); map them back to [-180, 180)
+        return {edge : (g.edge_label_artists[edge].get_rotation() + 180) % 360 - 180 for edge in edges}
+
+    fig, ax = plt.subplots()
+    g = Graph(edges, node_layout=node_layout, edge_labels=True, edge_label_rotate=True, ax=ax)
+    drawn = get_rotations(g)
+    g._update_edge_label_positions(edges)
+    updated = get_rotations(g)
+
+    for edge, angle in expected.items():
+        assert np.isclose(drawn[edge], angle, atol=1e-6)
+        assert np.isclose(updated[edge], angle, atol=1e-6)
+    plt.close(fig)
@@ -21,6 +21,13 @@ def test_edge_list_with_weights():
     assert g.edges == [(0, 1)]
 
 
+def test_edge_list_with_duplicate_weighted_edges():
+    # the weight of the first (0, 1) edge is overwritten by the second; the remaining weights are all equal
+    nodes, edges, edge_weight = parse_graph([(0, 1, 1.0), (0, 1, 2.0), (1, 2, 2.0)])
+    assert edges == [(0, 1), (1, 2)]
+    assert edge_weight is None
+
+
 def test_sparse_matrix_format():
     g = Graph(np.array([[0, 1, 0.5]]))
     assert g.nodes == [0, 1]
@@ -35,6 +42,16 @@ def test_full_rank_matrix_format():
     assert g.edges == [(0, 1)]
 
 
+def test_boolean_full_rank_matrix_format():
+    w = np.zeros((5, 5), dtype=bool)
+    w[0, 1] = True
+    w[1, 2] = True
+    nodes, edges, edge_weight = parse_graph(w)
+    assert nodes == [0, 1, 2, 3, 4]
+    assert edges == [(0, 1), (1, 2)]
+    assert edge_weight is None
+
+
 def test_networkx_graph():
     import networkx
     g = Graph(networkx.Graph([(0, 1)]))
@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+"""
+Test _utils.py.
+"""
+
+import numpy as np
+
+from netgraph._utils import (
+    _bspline,
+    _edge_list_to_index_array,
+    _get_node_position_array,
+    _split_selfloops,
+)
+
+
+def test_bspline_batch():
+    # evaluating multiple curves jointly should yield the same samples as evaluating them one by one
+    rng = np.random.default_rng(42)
+    control_vertices = rng.random((4, 6, 2))
+    for periodic in (False, True):
+        batch = _bspline(control_vertices, n=50, degree=3, periodic=periodic)
+        assert batch.shape == (4, 50, 2)
+        for cv, samples in zip(control_vertices, batch):
+            assert np.allclose(samples, _bspline(cv, n=50, degree=3, periodic=periodic))
+
+
+def test_edge_list_to_index_array():
+    edges = [('a', 'b'), ('b', 'c'), ('c', 'c')]
+    node_to_index = {'a' : 0, 'b' : 1, 'c' : 2}
+    edge_indices = _edge_list_to_index_array(edges, node_to_index)
+    assert np.array_equal(edge_indices, [[0, 1], [1, 2], [2, 2]])
+    assert _edge_list_to_index_array([], node_to_index).shape == (0, 2)
+
+
+def test_get_node_position_array():
+    node_positions = {
+        'a' : np.array([0.1, 0.2]),
+        'b' : (1, 2), # positions need not be float arrays
+        'c' : [0.5, 0.6],
+    }
+    positions = _get_node_position_array(node_positions)
+    assert positions.dtype == float
+    assert np.array_equal(positions, [[0.1, 0.2], [1., 2.], [0.5, 0.6]])
+    assert _get_node_position_array(dict()).shape == (0, 2)
+
+
+def test_split_selfloops():
+    edges = [(0, 1), (1, 1), (1, 2), (2, 2), (2, 0)]
+    non_selfloops, selfloops = _split_selfloops(edges)
+    assert non_selfloops == [(0, 1), (1, 2), (2, 0)]
+    assert selfloops == [(1, 1), (2, 2)]